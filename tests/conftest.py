@@ -0,0 +1,98 @@
+from pathlib import Path
+import re
+import sys
+import textwrap
+from typing import Callable
+import pytest
+from rdflib import Graph
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+ONTOLOGY_PATH = Path(__file__).parent.parent / "ontology/dwc-owl-v2.ttl"
+README_PATH = Path(__file__).parent.parent / "README.md"
+
+# The input graphs of the stories of the README.
+#
+STORY_1 = """
+@prefix dwc: <http://rs.tdwg.org/dwc/terms/> .
+@prefix dwcdp: <http://rs.tdwg.org/dwcdp/terms/> .
+
+<http://bioboum.ca/identification/0ace24a7-2a0d-4f5f-903e-215a43aed359> dwcdp:basedOn <http://bioboum.ca/material/bc044ff4-3896-4617-9829-2f2345255887> ;
+    dwcdp:identifiedBy <https://orcid.org/0000-0003-1336-5554> ;
+    dwcdp:used <https://archive.org/details/fishesofsouthern00gono> .
+
+<https://zenodo.org/records/14899069/files/AAV3FF_00249_01.JPG> dwcdp:mediaOf <http://bioboum.ca/material/bc044ff4-3896-4617-9829-2f2345255887> .
+
+<http://bioboum.ca/material/bc044ff4-3896-4617-9829-2f2345255887> dwc:preparations "formalin" ;
+    dwcdp:evidenceFor <http://bioboum.ca/occurrence/e4ea05b4-3b87-4f49-8797-5629b9bfa578> .
+"""
+
+STORY_2 = """
+@prefix dwcdp: <http://rs.tdwg.org/dwcdp/terms/> .
+
+<http://bioboum.ca/protocol/imp-3> dwcdp:followedBy <http://bioboum.ca/nucleotide-analysis/imp-3-p133-2b-p133-2bs> .
+
+<http://bioboum.ca/protocol/insektmobilen> dwcdp:followedBy <http://bioboum.ca/event/p133-2b> .
+
+<https://api.gbif.org/v1/image/cache/occurrence/4850060137/media/5ddb1808d104654811554a54e12da753> dwcdp:mediaOf <http://bioboum.ca/material/p133-2bs> .
+
+<http://bioboum.ca/nucleotide-analysis/imp-3-p133-2b-p133-2bs> dwcdp:analysisOf <http://bioboum.ca/material/p133-2bs> ;
+    dwcdp:produced <http://bioboum.ca/nucleotide-sequence/0217d085689bcb62a7403d102999a9c19205289c> .
+
+<http://bioboum.ca/material/p133-2bs> dwcdp:collectedDuring <http://bioboum.ca/event/p133-2b> .
+"""
+
+STORY_3 = """
+@prefix ac: <http://rs.tdwg.org/ac/terms/> .
+@prefix dcterms: <http://purl.org/dc/terms/> .
+@prefix dwc: <http://rs.tdwg.org/dwc/terms/> .
+@prefix dwcdp: <http://rs.tdwg.org/dwcdp/terms/> .
+
+<http://bioboum.ca/location/a6d13689-d957-4c54-bc15-ad5779f1d0b5> a dcterms:Location ;
+    dwc:locality "Barber's Point" .
+
+<https://media01.symbiota.org/media/pacific/HAW/HAW45/HAW45309.JPG> a ac:Media ;
+    dwcdp:mediaOf <http://bioboum.ca/material/d8702673-fa82-4076-bbff-1997d7c1285a> .
+
+<https://www.gbif.org/occurrence/5912078058> a dwc:Occurrence ;
+    dwcdp:spatialLocation <http://bioboum.ca/location/a6d13689-d957-4c54-bc15-ad5779f1d0b5> .
+
+<http://bioboum.ca/material/d8702673-fa82-4076-bbff-1997d7c1285a> a dwc:MaterialEntity ;
+    dwcdp:evidenceFor <https://www.gbif.org/occurrence/5912078058> .
+"""
+
+
+@pytest.fixture(scope="session")
+def ontology_url() -> str:
+    return str(ONTOLOGY_PATH)
+
+
+@pytest.fixture(scope="session")
+def ontology() -> Graph:
+    return Graph().parse(ONTOLOGY_PATH)
+
+
+@pytest.fixture
+def story_1() -> Graph:
+    return Graph().parse(data=STORY_1, format="turtle")
+
+
+@pytest.fixture
+def story_2() -> Graph:
+    return Graph().parse(data=STORY_2, format="turtle")
+
+
+@pytest.fixture
+def story_3() -> Graph:
+    return Graph().parse(data=STORY_3, format="turtle")
+
+
+@pytest.fixture(scope="session")
+def readme_graph() -> Callable[[int], Graph]:
+    """
+    Parse the Turtle block of the README with the given index, 1 and 3 being
+    what HermiT infers from the inputs of stories 1 and 2.
+    """
+    blocks = re.findall(r"```turtle\n(.*?)```", README_PATH.read_text(encoding="utf-8"), re.S)
+
+    return lambda index: Graph().parse(data=textwrap.dedent(blocks[index]), format="turtle")
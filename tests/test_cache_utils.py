@@ -0,0 +1,50 @@
+from pathlib import Path
+import os
+from rdflib.graph import ReadOnlyGraphAggregate
+#
+from utils.cache_utils import ReasonerCache
+from utils.reasoner_utils import call_reasoner
+
+
+def test_round_trip(tmp_path, story_1):
+    cache = ReasonerCache(tmp_path)
+    cache.put("key", story_1)
+
+    assert set(cache.get("key")) == set(story_1)
+    assert cache.get("other") is None
+
+
+def test_entry_evicted_while_read_is_a_miss(tmp_path, monkeypatch, story_1):
+    cache = ReasonerCache(tmp_path)
+    cache.put("key", story_1)
+
+    # Evicted right after its modification time was refreshed.
+    def utime(path, *args, **kwargs):
+        Path(path).unlink()
+
+    monkeypatch.setattr("utils.cache_utils.os.utime", utime)
+
+    assert cache.get("key") is None
+
+
+def test_eviction_keeps_the_recent_entries(tmp_path, story_1):
+    cache = ReasonerCache(tmp_path)
+    cache.put("old", story_1)
+    os.utime(tmp_path / "old.nt", ns=(0, 0))
+
+    cache.max_bytes = (tmp_path / "old.nt").stat().st_size
+    cache.put("new", story_1)
+
+    assert cache.get("old") is None
+    assert cache.get("new") is not None
+
+
+def test_entries_leave_the_tbox_out(tmp_path, ontology, story_1):
+    cache = ReasonerCache(tmp_path)
+    graph = ReadOnlyGraphAggregate([ontology, story_1])
+
+    miss = call_reasoner(graph, reasoner="rules", cache=cache, cache_key="key")
+    hit = call_reasoner(graph, reasoner="rules", cache=cache, cache_key="key")
+
+    assert len(cache.get("key")) < len(ontology) / 10
+    assert set(hit) == set(miss)
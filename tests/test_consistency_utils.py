@@ -0,0 +1,38 @@
+import pytest
+from rdflib import Graph, URIRef
+#
+from utils.reasoner_utils import check_consistency
+
+
+def test_story_3_is_inconsistent(ontology_url, story_3):
+    report = check_consistency(story_3, ontology_url, fallback=False)
+
+    assert not report.consistent
+    assert report.checked_by == "rules"
+    assert any(URIRef("https://www.gbif.org/occurrence/5912078058") in clash.individuals for clash in report.clashes)
+
+
+@pytest.mark.parametrize("prop", ["sex", "caste", "reproductiveCondition", "vitality"])
+def test_union_members_inherit_disjointness(ontology_url, prop):
+    # Both members of the domain are dwc:Assertions, which are disjoint with dwc:Occurrence.
+    graph = Graph().parse(data=f"""
+        @prefix dwc: <http://rs.tdwg.org/dwc/terms/> .
+
+        <http://example.org/o1> a dwc:Occurrence ; dwc:{prop} "female" .
+    """, format="turtle")
+
+    report = check_consistency(graph, ontology_url)
+
+    assert not report.consistent
+    assert report.checked_by == "rules"
+    assert [clash.kind for clash in report.clashes] == ["union"]
+
+
+def test_union_members_are_consistent(ontology_url):
+    graph = Graph().parse(data="""
+        @prefix dwc: <http://rs.tdwg.org/dwc/terms/> .
+
+        <http://example.org/a1> a dwc:OccurrenceAssertion ; dwc:sex "female" .
+    """, format="turtle")
+
+    assert check_consistency(graph, ontology_url, fallback=False).consistent
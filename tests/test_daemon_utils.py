@@ -0,0 +1,77 @@
+from pathlib import Path
+import time
+import pytest
+from rdflib import Graph
+from rdflib.graph import ReadOnlyGraphAggregate
+#
+from utils import reasoner_utils
+from utils.canonical_utils import canonicalize
+from utils.daemon_utils import ReasonerDaemon
+from utils.reasoner_utils import ReasoningEngine, load_ontology, reason_with_rules
+
+
+class FakeDaemon:
+    """
+    Stands in for ReasonerDaemon, answering like ReasonerServer.java does:
+    the input axioms plus the inferred ones, without the preloaded TBox.
+    """
+
+    def __init__(self, ontology_url: str) -> None:
+        self.ontology_url = ontology_url
+
+    def reason(self, input_path: Path, output_path: Path, **options) -> None:
+        ontology = load_ontology(self.ontology_url)
+        data = Graph().parse(source=input_path, format="nt")
+        out = reason_with_rules(ReadOnlyGraphAggregate([ontology, data])) - ontology
+        out.serialize(destination=output_path, format="nt", encoding="utf-8")
+
+    def peak_rss(self) -> None:
+        return None
+
+
+def fake_robot(command: list, metrics, **kwargs) -> None:
+    # "robot reason" answers with its whole input, the TBox included, plus the inferred axioms.
+    input_path = command[command.index("--input") + 1]
+    output_path = command[command.index("--output") + 1]
+    reason_with_rules(Graph().parse(source=input_path)).serialize(destination=output_path, format="turtle", encoding="utf-8")
+
+
+def copy(graph_post: Graph, graph: Graph) -> Graph:
+    out = Graph()
+    out.addN((*triple, out) for triple in graph_post)
+    return out
+
+
+@pytest.mark.parametrize("extract", [copy, "describe"])
+def test_daemon_and_robot_give_the_same_graph(monkeypatch, ontology_url, story_1, extract):
+    monkeypatch.setattr(reasoner_utils, "run_measured", fake_robot)
+
+    robot = ReasoningEngine(ontology_url, transport="ntriples", extract=extract).reason(story_1)
+    daemon = ReasoningEngine(ontology_url, transport="ntriples", extract=extract, daemon=FakeDaemon(ontology_url)).reason(story_1)
+
+    # The blank nodes of the TBox get new labels on their way through the files.
+    assert set(canonicalize(daemon)) == set(canonicalize(robot))
+
+
+def test_hung_daemons_time_out_and_restart(tmp_path, ontology_url):
+    # Hangs on the first start, answers on the next one.
+    java = tmp_path / "java"
+    java.write_text(f"""#!/bin/sh
+echo READY
+if [ -e {tmp_path}/started ]; then
+    while read line && [ "$line" != QUIT ]; do printf 'OK\\tconsistent\\n'; done
+else
+    touch {tmp_path}/started
+    sleep 60
+fi
+""")
+    java.chmod(0o755)
+
+    with ReasonerDaemon(ontology_url, java=str(java), timeout=0.5) as daemon:
+        start = time.monotonic()
+
+        with pytest.raises(TimeoutError):
+            daemon.check(tmp_path / "data.nt")
+
+        assert time.monotonic() - start < 5
+        assert daemon.check(tmp_path / "data.nt")
@@ -0,0 +1,40 @@
+from rdflib import Graph, Namespace
+from rdflib.graph import ReadOnlyGraphAggregate
+from rdflib.namespace import OWL
+#
+from utils.module_utils import extract_module, graph_signature
+from utils.rule_utils import compile_rules, materialize
+
+EX = Namespace("http://example.org/")
+
+
+def _about(graph: Graph, resources: set) -> set:
+    return {triple for triple in graph if triple[0] in resources or triple[2] in resources}
+
+
+def test_modules_keep_the_entailments_about_the_data(ontology, story_1, story_2):
+    for story in (story_1, story_2):
+        module = extract_module(ontology, graph_signature(story))
+        resources = set(story.subjects()) | set(story.objects())
+
+        assert len(module) < len(ontology)
+        assert _about(materialize(ReadOnlyGraphAggregate([module, story]), compile_rules(module)), resources) == _about(
+            materialize(ReadOnlyGraphAggregate([ontology, story]), compile_rules(ontology)), resources
+        )
+
+
+def test_modules_keep_enumerated_classes():
+    ontology = Graph().parse(data="""
+        @prefix ex: <http://example.org/> .
+        @prefix owl: <http://www.w3.org/2002/07/owl#> .
+        @prefix rdfs: <http://www.w3.org/2000/01/rdf-schema#> .
+
+        ex:Colour a owl:Class ; owl:oneOf ( ex:red ex:green ) .
+        ex:Shape a owl:Class .
+        ex:Square a owl:Class ; rdfs:subClassOf ex:Shape .
+    """, format="turtle")
+
+    module = extract_module(ontology, {EX["Square"]})
+
+    assert (EX["Colour"], OWL["oneOf"], ontology.value(EX["Colour"], OWL["oneOf"])) in module
+    assert EX["red"] in set(module.objects())
@@ -0,0 +1,57 @@
+from typing import Callable
+import pytest
+#
+from utils.pipeline_utils import Stage, load_state, run_stages
+
+
+def test_stages_run_after_their_inputs(tmp_path):
+    order = []
+
+    def stage(name: str) -> Callable[[], bool]:
+        return lambda: order.append(name) or True
+
+    stages = [
+        Stage("c", stage("c"), inputs=[], after=["b"]),
+        Stage("b", stage("b"), inputs=[], after=["a"]),
+        Stage("a", stage("a"), inputs=[]),
+    ]
+
+    assert run_stages(stages, tmp_path / "state.json", jobs=3) == {"a": True, "b": True, "c": True}
+    assert order == ["a", "b", "c"]
+
+
+def test_raising_stage_fails_alone(tmp_path, capsys):
+    def broken() -> bool:
+        raise ImportError("No module named 'pylode'")
+
+    stages = [
+        Stage("docs", broken, inputs=[]),
+        Stage("serialize", lambda: True, inputs=[]),
+        Stage("convert", lambda: True, inputs=[], after=["docs"]),
+    ]
+
+    results = run_stages(stages, tmp_path / "state.json", jobs=2)
+
+    assert results == {"docs": False, "serialize": True, "convert": False}
+    assert set(load_state(tmp_path / "state.json")) == {"serialize"}
+    assert "docs: failed, ImportError" in capsys.readouterr().out
+
+
+def test_incremental_skips_current_stages(tmp_path):
+    runs = []
+    stages = [Stage("a", lambda: runs.append("a") or True, inputs=[])]
+
+    run_stages(stages, tmp_path / "state.json", incremental=True)
+    run_stages(stages, tmp_path / "state.json", incremental=True)
+
+    assert runs == ["a"]
+
+
+def test_cycle_is_an_error(tmp_path):
+    stages = [
+        Stage("a", lambda: True, inputs=[], after=["b"]),
+        Stage("b", lambda: True, inputs=[], after=["a"]),
+    ]
+
+    with pytest.raises(ValueError):
+        run_stages(stages, tmp_path / "state.json")
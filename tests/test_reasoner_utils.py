@@ -0,0 +1,85 @@
+from email.message import Message
+import asyncio
+import io
+import subprocess
+import pytest
+from rdflib import URIRef
+from rdflib.graph import ReadOnlyGraphAggregate
+from rdflib.namespace import OWL, RDF
+#
+from utils.async_utils import AsyncReasoner
+from utils import reasoner_utils
+from utils.reasoner_utils import call_reasoner, check_consistency, load_ontology, reason_with_ontology
+
+
+def test_rules_do_not_type_the_ontology_as_individuals(ontology, story_1):
+    out = call_reasoner(ReadOnlyGraphAggregate([ontology, story_1]), reasoner="rules")
+    individuals = set(out.subjects(RDF["type"], OWL["NamedIndividual"]))
+    terms = {
+        subj
+        for kind in (OWL["Class"], OWL["ObjectProperty"], OWL["DatatypeProperty"], OWL["AnnotationProperty"])
+        for subj in ontology.subjects(RDF["type"], kind)
+    }
+
+    assert not individuals & terms
+    assert URIRef("https://orcid.org/0000-0003-1336-5554") in individuals
+
+
+def test_rules_engine_types_only_the_data(ontology_url, story_1):
+    out = reason_with_ontology(story_1, ontology_url, reasoner="rules")
+    individuals = set(out.subjects(RDF["type"], OWL["NamedIndividual"]))
+
+    assert individuals == set(story_1.subjects()) | {obj for obj in story_1.objects() if isinstance(obj, URIRef)}
+
+
+def test_async_rules_engine_matches_the_synchronous_one(ontology_url, story_2):
+    out = asyncio.run(AsyncReasoner().reason_with_ontology(story_2, ontology_url, reasoner="rules"))
+
+    assert set(out) == set(reason_with_ontology(story_2, ontology_url, reasoner="rules"))
+
+
+@pytest.mark.parametrize(
+    "returncode, output, consistent",
+    [
+        (0, "Class <http://www.w3.org/2002/07/owl#Thing> is satisfiable.\n", True),
+        (0, "Class <http://www.w3.org/2002/07/owl#Thing> is not satisfiable.\n", False),
+        (1, "org.semanticweb.owlapi.reasoner.InconsistentOntologyException: Inconsistent ontology\n", False),
+    ],
+)
+def test_hermit_answers(monkeypatch, ontology_url, story_1, returncode, output, consistent):
+    monkeypatch.setattr(subprocess, "run", lambda args, **kwargs: subprocess.CompletedProcess(args, returncode, stdout=output))
+
+    assert check_consistency(story_1, ontology_url, fallback=True).consistent is consistent
+
+
+def test_hermit_failures_are_not_inconsistencies(monkeypatch, ontology_url, story_1):
+    monkeypatch.setattr(subprocess, "run", lambda args, **kwargs: subprocess.CompletedProcess(args, 1, stdout="Error: Unable to access jarfile jarfiles/HermiT.jar\n"))
+
+    with pytest.raises(subprocess.CalledProcessError):
+        check_consistency(story_1, ontology_url, fallback=True)
+
+
+def test_remote_ontology_without_validator_is_downloaded_once(monkeypatch, ontology_url):
+    body = open(ontology_url, "rb").read()
+    requests = []
+
+    def urlopen(request):
+        method = getattr(request, "method", None) or "GET"
+        requests.append(method)
+        response = io.BytesIO(b"" if method == "HEAD" else body)
+        response.headers = Message()
+        response.headers["Content-Type"] = "text/turtle"
+        return response
+
+    monkeypatch.setattr(reasoner_utils, "urlopen", urlopen)
+    url = "https://example.org/dwc-owl"
+
+    try:
+        first = load_ontology(url)
+        assert requests == ["HEAD", "GET"]
+        assert len(first) == len(load_ontology(ontology_url))
+
+        assert load_ontology(url) is first
+        assert requests == ["HEAD", "GET", "HEAD", "GET"]
+    finally:
+        reasoner_utils.clear_ontology_cache()
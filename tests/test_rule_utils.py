@@ -0,0 +1,67 @@
+import pytest
+from rdflib import Namespace
+from rdflib.graph import ReadOnlyGraphAggregate
+from rdflib.namespace import RDF
+#
+from utils.reasoner_utils import load_rules
+from utils.rule_utils import Materializer, compile_rules, materialize
+
+DWC = Namespace("http://rs.tdwg.org/dwc/terms/")
+DWCDP = Namespace("http://rs.tdwg.org/dwcdp/terms/")
+BIOBOUM = Namespace("http://bioboum.ca/")
+
+
+@pytest.mark.parametrize("story, expected", [("story_1", 1), ("story_2", 3)])
+def test_rules_infer_what_hermit_does_in_the_readme(request, ontology, readme_graph, story, expected):
+    # HermiT is not run here, the README holds what it inferred.
+    out = materialize(ReadOnlyGraphAggregate([ontology, request.getfixturevalue(story)]), compile_rules(ontology))
+
+    assert set(readme_graph(expected)) <= set(out)
+
+
+def _closure(rules, *graphs) -> set:
+    engine = Materializer(rules)
+
+    for graph in graphs:
+        engine.add(graph)
+
+    return set(engine)
+
+
+def test_additions_match_a_fresh_closure(ontology_url, story_1, story_2):
+    rules = load_rules(ontology_url)
+    engine = Materializer(rules)
+    engine.add(story_1)
+    added = engine.add(story_2)
+
+    assert set(engine) == _closure(rules, story_1 + story_2)
+    assert added == set(engine) - _closure(rules, story_1)
+    assert not engine.add(story_2)
+
+
+def test_removals_match_a_fresh_closure(ontology_url, story_1, story_2):
+    rules = load_rules(ontology_url)
+    engine = Materializer(rules)
+    engine.add(story_1 + story_2)
+    removed = engine.remove(story_2)
+
+    assert set(engine) == _closure(rules, story_1)
+    assert removed == _closure(rules, story_1 + story_2) - _closure(rules, story_1)
+    assert not engine.remove(story_2)
+
+
+def test_removals_keep_what_is_still_derivable(ontology_url, story_2):
+    rules = load_rules(ontology_url)
+    engine = Materializer(rules)
+    material = BIOBOUM["material/p133-2bs"]
+    media = next(story_2.subjects(DWCDP["mediaOf"], material))
+    triple = (media, DWCDP["mediaOf"], material)
+
+    # Typed by both the range of mediaOf and the domain of collectedDuring.
+    engine.add(story_2)
+    engine.remove([triple])
+    story_2.remove(triple)
+
+    assert (material, RDF["type"], DWC["MaterialEntity"]) in engine
+    assert (material, DWCDP["hasMedia"], media) not in engine
+    assert set(engine) == _closure(rules, story_2)
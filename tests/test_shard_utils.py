@@ -0,0 +1,45 @@
+from rdflib import Graph, Namespace
+from rdflib.namespace import OWL, RDF
+#
+from utils.reasoner_utils import ReasoningEngine
+from utils.shard_utils import connected_components, joining_predicates
+
+DWCDP = Namespace("http://rs.tdwg.org/dwcdp/terms/")
+EX = Namespace("http://example.org/")
+
+
+def _hub_graph() -> Graph:
+    graph = Graph()
+
+    for i in range(20):
+        graph.add((EX[f"e{i}"], DWCDP["partOf"], EX["hub"]))
+        graph.add((EX[f"e{i}"], RDF["type"], OWL["NamedIndividual"]))
+
+    graph.add((EX["hub"], DWCDP["partOf"], EX["parent"]))
+
+    return graph
+
+
+def test_transitive_properties_join_across_hubs(ontology):
+    assert {DWCDP["partOf"], OWL["sameAs"]} <= joining_predicates(ontology)
+    assert DWCDP["partOf"] not in joining_predicates(Graph())
+
+    graph = _hub_graph()
+
+    assert len(connected_components(graph, hub_degree=10)) > 1
+    assert len(connected_components(graph, hub_degree=10, joining=joining_predicates(ontology))) == 1
+
+
+def test_entailments_through_hubs_survive_sharding(ontology_url):
+    sharded = ReasoningEngine(ontology_url, reasoner="rules", shards=4, hub_degree=10).reason(_hub_graph())
+    unsharded = ReasoningEngine(ontology_url, reasoner="rules").reason(_hub_graph())
+
+    assert (EX["e0"], DWCDP["partOf"], EX["parent"]) in sharded
+    assert set(sharded) == set(unsharded)
+
+
+def test_sharded_reasoning_matches_unsharded(ontology_url, story_1, story_2):
+    graph = story_1 + story_2
+    sharded = ReasoningEngine(ontology_url, reasoner="rules", shards=2, hub_degree=2).reason(graph)
+
+    assert set(sharded) == set(ReasoningEngine(ontology_url, reasoner="rules").reason(graph))
@@ -0,0 +1,44 @@
+import pytest
+from rdflib import Literal, URIRef
+from rdflib.namespace import OWL, RDF, RDFS
+#
+from utils.snapshot_utils import SnapshotView, load_snapshot, write_snapshot
+
+EVENT = URIRef("http://rs.tdwg.org/dwc/terms/Event")
+
+
+def test_snapshots_round_trip(tmp_path, ontology, story_1):
+    story_1.add((EVENT, RDFS["comment"], Literal("Événement", lang="fr")))
+
+    for graph in (ontology, story_1):
+        write_snapshot(graph, tmp_path / "graph.snap")
+        loaded = load_snapshot(tmp_path / "graph.snap")
+
+        # Blank nodes keep their labels, so the triples are the very same.
+        assert set(loaded) == set(graph)
+        assert dict(loaded.namespaces()) == dict(graph.namespaces())
+
+
+def test_snapshots_are_byte_stable(tmp_path, ontology):
+    write_snapshot(ontology, tmp_path / "first.snap")
+    write_snapshot(load_snapshot(tmp_path / "first.snap"), tmp_path / "second.snap")
+
+    assert (tmp_path / "first.snap").read_bytes() == (tmp_path / "second.snap").read_bytes()
+
+
+def test_snapshot_views_answer_like_the_graph(tmp_path, ontology):
+    write_snapshot(ontology, tmp_path / "ontology.snap")
+
+    with SnapshotView(tmp_path / "ontology.snap") as view:
+        assert len(view) == len(ontology)
+        assert set(view.triples(EVENT)) == set(ontology.triples((EVENT, None, None)))
+        assert set(view.triples(None, RDF["type"], OWL["Class"])) == set(ontology.triples((None, RDF["type"], OWL["Class"])))
+        assert view.value(EVENT, RDFS["label"]) == ontology.value(EVENT, RDFS["label"])
+        assert (EVENT, RDF["type"], OWL["Class"]) in view
+        assert view.term_id(URIRef("http://example.org/nothing")) is None
+        assert list(view.triples(URIRef("http://example.org/nothing"))) == []
+
+
+def test_other_files_are_not_snapshots(tmp_path, ontology_url):
+    with pytest.raises(ValueError):
+        SnapshotView(ontology_url)
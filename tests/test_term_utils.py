@@ -0,0 +1,52 @@
+import json
+from rdflib import Graph, Literal, Namespace
+from rdflib.collection import Collection
+from rdflib.namespace import OWL, RDFS, XSD
+#
+from utils.term_utils import load_term_file
+
+DWC = Namespace("http://rs.tdwg.org/dwc/terms/")
+
+TERMS = {
+    "prefixes": {"dwc": str(DWC), "xsd": str(XSD)},
+    "terms": [
+        {
+            "builder": "createRDP",
+            "name": "startDayOfYear",
+            "namespace": "dwc",
+            "pref_label": {"@value": "Start Day Of Year", "@language": "en"},
+            "range_n": {"@id": "xsd:integer"},
+            "restrictions": [
+                [{"@id": "xsd:minInclusive"}, 1, {"@id": "xsd:integer"}],
+                [{"@id": "xsd:maxInclusive"}, 366, {"@id": "xsd:integer"}],
+            ],
+            "domains": {"@id": "dwc:Event"},
+            "version_of_s": "http://rs.tdwg.org/dwc/terms/startDayOfYear",
+        },
+    ],
+}
+
+
+def test_restricted_datatype_property(tmp_path):
+    path = tmp_path / "dwc.json"
+    path.write_text(json.dumps(TERMS))
+
+    g = Graph()
+    assert load_term_file(path, g, cache_dir=None) == 1
+
+    datatype = g.value(DWC["startDayOfYear"], RDFS["range"])
+    facets = {facet: bound for restriction in Collection(g, g.value(datatype, OWL["withRestrictions"])) for facet, bound in g.predicate_objects(restriction)}
+
+    assert g.value(datatype, OWL["onDatatype"]) == XSD["integer"]
+    assert facets == {XSD["minInclusive"]: Literal("1", datatype=XSD["integer"]), XSD["maxInclusive"]: Literal("366", datatype=XSD["integer"])}
+
+
+def test_cached_terms_are_not_built_again(tmp_path):
+    path = tmp_path / "dwc.json"
+    path.write_text(json.dumps(TERMS))
+
+    first, second = Graph(), Graph()
+
+    assert load_term_file(path, first, cache_dir=tmp_path / "cache") == 1
+    assert load_term_file(path, second, cache_dir=tmp_path / "cache") == 0
+    assert len(first) == len(second)
@@ -0,0 +1,175 @@
+from pathlib import Path
+import asyncio
+import tempfile
+from rdflib import Graph
+#
+from utils.cache_utils import ReasonerCache, apply_delta, graph_digest, result_delta
+from utils.reasoner_utils import (
+    ExtractionStrategy,
+    extraction_strategy,
+    materialize_with_ontology,
+    reason_with_rules,
+    reasoner_input,
+    reasoner_options,
+    robot_command,
+    transport_files,
+)
+
+
+class AsyncReasoner:
+    """
+    Reason with ROBOT from asyncio code without blocking the event loop.
+
+    ROBOT runs as an asyncio subprocess, at most max_concurrency at a time.
+    Serializing the input and parsing the output happen in worker threads
+    outside of that limit, so they overlap with the reasoner runs of other
+    requests.
+
+    A call taking longer than its timeout, or timeout for calls that do not
+    give their own, raises TimeoutError. The reasoner process is killed when
+    a call times out or is cancelled.
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int = 4,
+        timeout: float | None = None,
+        tmp_dir: str | None = None,
+    ) -> None:
+        self.timeout = timeout
+        self.tmp_dir = tmp_dir
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def _run_robot(self, args: list) -> None:
+        async with self._semaphore:
+            process = await asyncio.create_subprocess_exec(
+                *args,
+                stdout=asyncio.subprocess.DEVNULL,
+                stderr=asyncio.subprocess.DEVNULL,
+            )
+
+            try:
+                await process.wait()
+            finally:
+                # Timed out or cancelled
+                if process.returncode is None:
+                    process.kill()
+                    await process.wait()
+
+    async def _run_reasoner(
+        self,
+        graph: Graph,
+        reasoner: str,
+        axiom_generators: list[str],
+        include_subclasses: bool,
+        transport: str,
+    ) -> Graph:
+        if reasoner == "rules":
+            return await asyncio.to_thread(reason_with_rules, graph)
+
+        if transport == "pipe":
+            raise ValueError("The pipe transport needs a reasoner daemon")
+
+        # A thread still writing when the call is cancelled may leave files behind.
+        with tempfile.TemporaryDirectory(dir=self.tmp_dir, ignore_cleanup_errors=True) as tmpdir:
+            tmp_path_pre, format_pre, tmp_path_post, format_post = transport_files(transport, Path(tmpdir))
+
+            await asyncio.to_thread(graph.serialize, destination=tmp_path_pre, format=format_pre, encoding="utf-8")
+            await self._run_robot(robot_command(reasoner, axiom_generators, include_subclasses, tmp_path_pre, tmp_path_post))
+
+            return await asyncio.to_thread(Graph().parse, source=tmp_path_post, format=format_post)
+
+    async def call_reasoner(
+        self,
+        graph: Graph,
+        reasoner: str = "hermit",
+        axiom_generators: list[str] = ["ClassAssertion", "PropertyAssertion"],
+        include_subclasses: bool = True,
+        transport: str = "turtle",
+        cache: ReasonerCache | None = None,
+        cache_key: str | None = None,
+        timeout: float | None = None,
+    ) -> Graph:
+        """
+        Same as utils.reasoner_utils.call_reasoner, as a coroutine.
+
+        Only the "turtle" and "ntriples" transports are available, there is
+        no daemon to stream to.
+        """
+        return await asyncio.wait_for(
+            self._call_reasoner(graph, reasoner, axiom_generators, include_subclasses, transport, cache, cache_key),
+            self.timeout if timeout is None else timeout,
+        )
+
+    async def _call_reasoner(
+        self,
+        graph: Graph,
+        reasoner: str,
+        axiom_generators: list[str],
+        include_subclasses: bool,
+        transport: str,
+        cache: ReasonerCache | None,
+        cache_key: str | None,
+    ) -> Graph:
+        if cache is None:
+            return await self._run_reasoner(graph, reasoner, axiom_generators, include_subclasses, transport)
+
+        if cache_key is None:
+            digest = await asyncio.to_thread(graph_digest, graph)
+            cache_key = cache.key(digest, "", *reasoner_options(reasoner, axiom_generators, include_subclasses))
+
+        delta = await asyncio.to_thread(cache.get, cache_key)
+
+        if delta is not None:
+            return await asyncio.to_thread(apply_delta, delta, graph)
+
+        g_post = await self._run_reasoner(graph, reasoner, axiom_generators, include_subclasses, transport)
+        await asyncio.to_thread(cache.put, cache_key, await asyncio.to_thread(result_delta, g_post, graph))
+
+        return g_post
+
+    async def reason_with_ontology(
+        self,
+        graph: Graph,
+        ontology_url: str,
+        reasoner: str = "hermit",
+        transport: str = "turtle",
+        cache: ReasonerCache | None = None,
+        module: bool = False,
+        extract: str | ExtractionStrategy = "describe",
+        timeout: float | None = None,
+    ) -> Graph:
+        """
+        Same as utils.reasoner_utils.ReasoningEngine.reason, as a coroutine.
+
+        The timeout covers the whole call, preparation and extraction included.
+        """
+        return await asyncio.wait_for(
+            self._reason_with_ontology(graph, ontology_url, reasoner, transport, cache, module, extraction_strategy(extract)),
+            self.timeout if timeout is None else timeout,
+        )
+
+    async def _reason_with_ontology(
+        self,
+        graph: Graph,
+        ontology_url: str,
+        reasoner: str,
+        transport: str,
+        cache: ReasonerCache | None,
+        module: bool,
+        extract: ExtractionStrategy,
+    ) -> Graph:
+        if reasoner == "rules":
+            graph_post = await asyncio.to_thread(materialize_with_ontology, graph, ontology_url)
+        else:
+            graph_pre, cache_key = await asyncio.to_thread(reasoner_input, graph, ontology_url, None, reasoner, cache, module)
+            graph_post = await self._call_reasoner(
+                graph_pre, reasoner, ["ClassAssertion", "PropertyAssertion"], True, transport, cache, cache_key
+            )
+
+        out = await asyncio.to_thread(extract, graph_post, graph)
+
+        for prefix, namespace in graph.namespaces():
+            out.bind(prefix, namespace)
+
+        return out
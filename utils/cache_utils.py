@@ -0,0 +1,139 @@
+from pathlib import Path
+import hashlib
+import os
+import tempfile
+import threading
+from rdflib import BNode, Graph
+from rdflib.compare import to_isomorphic
+
+
+def graph_digest(graph: Graph) -> str:
+    """
+    Hash a graph so that isomorphic graphs, whatever their blank node labels, hash alike.
+    """
+    return "%x" % to_isomorphic(graph).graph_digest()
+
+
+def result_delta(graph_post: Graph, graph: Graph) -> Graph:
+    """
+    Return what a reasoner added to the graph it was given, which is what gets cached of its result.
+
+    Triples with blank nodes are left out. The reasoners only infer axioms
+    about named terms, and ROBOT gives the blank nodes of its input, those
+    of the TBox included, other labels in its output.
+    """
+    delta = Graph()
+    delta.addN(
+        (subj, pred, obj, delta)
+        for subj, pred, obj in graph_post
+        if not isinstance(subj, BNode) and not isinstance(obj, BNode) and (subj, pred, obj) not in graph
+    )
+
+    return delta
+
+
+def apply_delta(delta: Graph, graph: Graph) -> Graph:
+    """
+    Rebuild the result of a reasoner from the graph it was given and its result_delta.
+    """
+    g_post = Graph()
+
+    for prefix, namespace in graph.namespaces():
+        g_post.bind(prefix, namespace)
+
+    g_post.addN((*triple, g_post) for triple in graph)
+    g_post.addN((*triple, g_post) for triple in delta)
+
+    return g_post
+
+
+class ReasonerCache:
+    """
+    Content-addressed store of reasoning results on disk.
+
+    Entries are N-Triples files named after their key. The reasoning calls
+    store the result_delta of their results only, so the TBox is neither
+    written with every entry nor parsed back on every hit. Reading an entry
+    refreshes its modification time, and the least recently used entries
+    are evicted once the directory grows past max_bytes.
+    """
+
+    def __init__(
+        self,
+        directory: str | Path = Path.home() / ".cache" / "dwc-owl" / "reasoner",
+        max_bytes: int = 1 << 30,
+    ) -> None:
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+    # The lock stays behind when the cache is sent to shard processes.
+    def __getstate__(self) -> dict:
+        return {"directory": self.directory, "max_bytes": self.max_bytes}
+
+    def __setstate__(self, state: dict) -> None:
+        self.__init__(**state)
+
+    @staticmethod
+    def key(*parts: str) -> str:
+        return hashlib.sha256("\0".join(parts).encode("utf-8")).hexdigest()
+
+    def _path(self, key: str) -> Path:
+        return self.directory / f"{key}.nt"
+
+    def get(self, key: str) -> Graph | None:
+        path = self._path(key)
+
+        # The entry may be evicted by another thread or process at any point,
+        # which is a miss. Once open, it reads whole even if it is removed.
+        try:
+            os.utime(path)
+            stream = open(path, "rb")
+        except OSError:
+            return None
+
+        g_cached = Graph()
+
+        with stream:
+            g_cached.parse(source=stream, format="nt")
+
+        return g_cached
+
+    def put(self, key: str, graph: Graph) -> None:
+        # Write next to the final name and rename, so readers never see half an entry.
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        os.close(fd)
+
+        try:
+            graph.serialize(destination=tmp_path, format="nt", encoding="utf-8")
+            os.replace(tmp_path, self._path(key))
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+        self.evict()
+
+    def evict(self) -> None:
+        with self._lock:
+            entries = []
+
+            for path in self.directory.glob("*.nt"):
+                try:
+                    stat = path.stat()
+                except FileNotFoundError:
+                    continue
+                entries.append((stat.st_mtime_ns, stat.st_size, path))
+
+            total = sum(size for _, size, _ in entries)
+
+            for _, size, path in sorted(entries):
+                if total <= self.max_bytes:
+                    break
+                path.unlink(missing_ok=True)
+                total -= size
+
+    def clear(self) -> None:
+        for path in self.directory.glob("*.nt"):
+            path.unlink(missing_ok=True)
@@ -0,0 +1,149 @@
+import hashlib
+import re
+from rdflib import BNode, Graph, Node, URIRef
+
+# The builders of utils/base.py mint a fresh BNode() for every restriction,
+# union and rdf:List, so the same ontology gets other blank node labels, and
+# another serialization, on every build. canonicalize() relabels them after
+# the term and axiom they belong to, and orders the triples.
+#
+# A blank node is labelled after
+#
+#   - its anchor, the shortest path of predicates from a named subject to it,
+#     "<http://rs.tdwg.org/dwc/terms/Event> rdfs:subClassOf" for a restriction
+#     on dwc:Event, the path from no subject at all for a blank node nothing
+#     points to, like a SWRL rule,
+#   - its content, a hash of the triples it is the subject of, in which the
+#     blank nodes it points to are replaced by their own content.
+#
+# The anchor tells apart blank nodes with the same content, like the
+# variables of a SWRL rule, and the content those with the same anchor, like
+# the restrictions of a class.
+#
+def _local_name(iri: URIRef) -> str:
+    return re.sub(r"\W", "", re.split(r"[/#]", str(iri).rstrip("/#"))[-1]) or "node"
+
+
+class _Labeller:
+    def __init__(self, graph: Graph) -> None:
+        self.graph = graph
+        self.contents: dict[BNode, str] = {}
+        self.anchors: dict[BNode, tuple[str, str]] = {}
+        self.visiting: set[BNode] = set()
+
+    def content(self, node: BNode) -> str:
+        if node in self.contents:
+            return self.contents[node]
+
+        # Blank nodes pointing to each other, which OWL does not have, get no further.
+        if node in self.visiting:
+            return "cycle"
+
+        self.visiting.add(node)
+        lines = sorted(
+            f"{pred.n3()} {'_:' + self.content(obj) if isinstance(obj, BNode) else obj.n3()}"
+            for pred, obj in self.graph.predicate_objects(node)
+        )
+        self.visiting.discard(node)
+
+        self.contents[node] = hashlib.sha256("\n".join(lines).encode("utf-8")).hexdigest()
+        return self.contents[node]
+
+    def anchor(self, node: BNode) -> tuple[str, str] | None:
+        """
+        Return the path to a blank node and the local name of the subject it starts from.
+        """
+        if node in self.anchors:
+            return self.anchors[node]
+
+        if node in self.visiting:
+            return None
+
+        self.visiting.add(node)
+        paths = []
+
+        for subj, pred in self.graph.subject_predicates(node):
+            if isinstance(subj, BNode):
+                upstream = self.anchor(subj)
+                if upstream is not None:
+                    paths.append((f"{upstream[0]} {pred.n3()}", upstream[1]))
+            else:
+                paths.append((f"{subj.n3()} {pred.n3()}", _local_name(subj)))
+
+        self.visiting.discard(node)
+
+        self.anchors[node] = min(paths, key=lambda path: (len(path[0]), path[0])) if paths else ("", "node")
+        return self.anchors[node]
+
+    def label(self, node: BNode) -> str:
+        path, name = self.anchor(node)
+        digest = hashlib.sha256(f"{path}\n{self.content(node)}".encode("utf-8")).hexdigest()
+
+        return f"{name}_{digest[:16]}"
+
+
+def canonical_labels(graph: Graph) -> dict[BNode, BNode]:
+    """
+    Map the blank nodes of a graph to labels derived from the term and axiom they belong to.
+
+    Blank nodes with the same anchor and content are interchangeable, they
+    are numbered in the order of their current labels.
+    """
+    labeller = _Labeller(graph)
+    nodes = {node for triple in graph for node in triple if isinstance(node, BNode)}
+    labels: dict[str, list[BNode]] = {}
+
+    for node in nodes:
+        labels.setdefault(labeller.label(node), []).append(node)
+
+    mapping = {}
+
+    for label, same in labels.items():
+        if len(same) == 1:
+            mapping[same[0]] = BNode(label)
+            continue
+
+        for i, node in enumerate(sorted(same)):
+            mapping[node] = BNode(f"{label}_{i}")
+
+    return mapping
+
+
+class CanonicalGraph(Graph):
+    """
+    A graph listing its subjects in order.
+
+    The serializers of rdflib list the subjects in the order of the store,
+    which changes from one run to the next, and the triples of a subject in
+    the order they were added. The Turtle serializer sorts them itself, the
+    RDF/XML one does not.
+    """
+
+    def subjects(self, predicate=None, object=None, unique=False):
+        return iter(sorted(super().subjects(predicate, object, unique), key=lambda node: node.n3()))
+
+
+def canonicalize(graph: Graph) -> CanonicalGraph:
+    """
+    Return a copy of a graph with canonical blank node labels and its triples in order.
+
+    The copy keeps the namespace bindings of the graph, and serializes to
+    the same file for the same ontology.
+    """
+    mapping = canonical_labels(graph)
+
+    def relabel(node: Node) -> Node:
+        return mapping.get(node, node) if isinstance(node, BNode) else node
+
+    triples = sorted(
+        (tuple(relabel(node) for node in triple) for triple in graph),
+        key=lambda triple: tuple(node.n3() for node in triple),
+    )
+
+    canonical = CanonicalGraph()
+    for prefix, namespace in graph.namespaces():
+        canonical.bind(prefix, namespace, override=True, replace=True)
+
+    canonical.addN((subj, pred, obj, canonical) for subj, pred, obj in triples)
+
+    return canonical
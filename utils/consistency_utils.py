@@ -0,0 +1,343 @@
+from dataclasses import dataclass, field
+from decimal import Decimal
+from rdflib import BNode, Graph, Literal, Node, URIRef
+from rdflib.collection import Collection
+from rdflib.namespace import OWL, RDF, RDFS, XSD
+#
+from utils.rule_utils import Rule, compile_rules, materialize
+
+# Datatypes whose literals also belong to a broader datatype, with the
+# bounds of their integer value space where they have some.
+#
+XSD_PARENT = {
+    XSD["integer"]: XSD["decimal"],
+    XSD["nonNegativeInteger"]: XSD["integer"],
+    XSD["positiveInteger"]: XSD["nonNegativeInteger"],
+    XSD["nonPositiveInteger"]: XSD["integer"],
+    XSD["negativeInteger"]: XSD["nonPositiveInteger"],
+    XSD["long"]: XSD["integer"],
+    XSD["int"]: XSD["long"],
+    XSD["short"]: XSD["int"],
+    XSD["byte"]: XSD["short"],
+    XSD["unsignedLong"]: XSD["nonNegativeInteger"],
+    XSD["unsignedInt"]: XSD["unsignedLong"],
+    XSD["unsignedShort"]: XSD["unsignedInt"],
+    XSD["unsignedByte"]: XSD["unsignedShort"],
+    XSD["normalizedString"]: XSD["string"],
+    XSD["token"]: XSD["normalizedString"],
+    XSD["language"]: XSD["token"],
+    XSD["Name"]: XSD["token"],
+    XSD["NCName"]: XSD["Name"],
+    XSD["NMTOKEN"]: XSD["token"],
+    XSD["dateTimeStamp"]: XSD["dateTime"],
+}
+
+INTEGER_BOUNDS = {
+    XSD["integer"]: (None, None),
+    XSD["nonNegativeInteger"]: (0, None),
+    XSD["positiveInteger"]: (1, None),
+    XSD["nonPositiveInteger"]: (None, 0),
+    XSD["negativeInteger"]: (None, -1),
+    XSD["long"]: (-(1 << 63), (1 << 63) - 1),
+    XSD["int"]: (-(1 << 31), (1 << 31) - 1),
+    XSD["short"]: (-(1 << 15), (1 << 15) - 1),
+    XSD["byte"]: (-(1 << 7), (1 << 7) - 1),
+    XSD["unsignedLong"]: (0, (1 << 64) - 1),
+    XSD["unsignedInt"]: (0, (1 << 32) - 1),
+    XSD["unsignedShort"]: (0, (1 << 16) - 1),
+    XSD["unsignedByte"]: (0, (1 << 8) - 1),
+}
+
+FACETS = {
+    XSD["minInclusive"]: lambda value, bound: value >= bound,
+    XSD["maxInclusive"]: lambda value, bound: value <= bound,
+    XSD["minExclusive"]: lambda value, bound: value > bound,
+    XSD["maxExclusive"]: lambda value, bound: value < bound,
+}
+
+
+@dataclass
+class Clash:
+    """
+    A reason for an instance graph to be inconsistent with the ontology.
+    """
+
+    kind: str
+    individuals: tuple[Node, ...]
+    detail: str
+
+
+@dataclass
+class ConsistencyReport:
+    """
+    Outcome of a consistency check, with the clashes found by the detector.
+
+    checked_by is "rules" when the clash detector settled the question, or
+    the name of the reasoner it was handed to.
+    """
+
+    consistent: bool
+    checked_by: str
+    clashes: list[Clash] = field(default_factory=list)
+
+    @property
+    def offending(self) -> set[Node]:
+        return {individual for clash in self.clashes for individual in clash.individuals}
+
+
+def _datatype(literal: Literal) -> URIRef:
+    if literal.datatype is not None:
+        return literal.datatype
+
+    return RDF["langString"] if literal.language else XSD["string"]
+
+
+def _numeric(literal: Literal) -> Decimal | None:
+    # Only the decimal value space, float and double are apart from it in OWL 2.
+    datatype = _datatype(literal)
+
+    while datatype is not None and datatype != XSD["decimal"]:
+        datatype = XSD_PARENT.get(datatype)
+
+    return None if datatype is None else Decimal(str(literal.value))
+
+
+class ClashDetector:
+    """
+    Look for the clashes an instance graph most often has with the ontology,
+    without a DL reasoner.
+
+    The types of the individuals are first materialized with the rules of
+    utils/rule_utils.py, domains, ranges and universal restrictions
+    included. The detector then looks for:
+
+    - individuals of disjoint classes, or of owl:Nothing,
+    - individuals outside every class of a union domain or range, as far as
+      the disjointness of the classes or their superclasses tells,
+    - more distinct values of a datatype property than a maximum or exact
+      cardinality allows,
+    - literals outside the range of their datatype property, or ill-typed.
+
+    A clash always means the graph is inconsistent, but finding none is only
+    conclusive as long as the graph stays within what the detector looks at.
+    detect() says when it does not: individuals with more fillers of an
+    object property than a cardinality allows (which only clashes when the
+    fillers are provably different), OWL vocabulary used in the data itself,
+    and datatype ranges of an unknown form. Anonymous fillers of existential
+    restrictions are not looked into.
+    """
+
+    def __init__(
+        self,
+        ontology: Graph,
+        rules: list[Rule] | None = None,
+    ) -> None:
+        self.ontology = ontology
+        self.rules = compile_rules(ontology) if rules is None else rules
+        self.disjoint: dict[Node, set[Node]] = {}
+        # class -> [(property, maximum)]
+        self.data_cardinalities: dict[Node, list[tuple[URIRef, int]]] = {}
+        self.object_cardinalities: dict[Node, list[tuple[URIRef, int]]] = {}
+        # [(property, members, "domain" or "range")]
+        self.unions: list[tuple[URIRef, list[Node], str]] = []
+        # member of a union -> the classes it or one of its superclasses is disjoint with
+        self.union_disjoint: dict[Node, set[Node]] = {}
+        self.data_ranges: dict[URIRef, list[Node]] = {}
+
+        g = ontology
+        data_properties = set(g.subjects(RDF["type"], OWL["DatatypeProperty"]))
+
+        for subj, obj in g.subject_objects(OWL["disjointWith"]):
+            self._add_disjoint([subj, obj])
+
+        for group in g.subjects(RDF["type"], OWL["AllDisjointClasses"]):
+            self._add_disjoint(list(Collection(g, g.value(group, OWL["members"]))))
+
+        for cls, restriction in g.subject_objects(RDFS["subClassOf"]):
+            if (restriction, RDF["type"], OWL["Restriction"]) not in g:
+                continue
+
+            prop = g.value(restriction, OWL["onProperty"])
+
+            for cardinality in (OWL["maxCardinality"], OWL["cardinality"], OWL["maxQualifiedCardinality"], OWL["qualifiedCardinality"]):
+                count = g.value(restriction, cardinality)
+
+                if count is None:
+                    continue
+
+                if prop in data_properties:
+                    # Qualified ones count only the values of their data range.
+                    if g.value(restriction, OWL["onDataRange"]) is None:
+                        self.data_cardinalities.setdefault(cls, []).append((prop, int(count)))
+                else:
+                    self.object_cardinalities.setdefault(cls, []).append((prop, int(count)))
+
+        for side, pred in (("domain", RDFS["domain"]), ("range", RDFS["range"])):
+            for prop, cls in g.subject_objects(pred):
+                members = g.value(cls, OWL["unionOf"]) if isinstance(cls, BNode) else None
+
+                if members is not None and (cls, RDF["type"], RDFS["Datatype"]) not in g:
+                    self.unions.append((prop, list(Collection(g, members)), side))
+
+        # The types of the individuals are materialized, superclasses included,
+        # the members of the unions are not. dwc:OccurrenceAssertion is only
+        # disjoint with dwc:Occurrence through dwc:Assertion.
+        for _, members, _ in self.unions:
+            for member in members:
+                self.union_disjoint[member] = {
+                    other
+                    for superclass in g.transitive_objects(member, RDFS["subClassOf"])
+                    for other in self.disjoint.get(superclass, ())
+                }
+
+        for prop in data_properties:
+            for data_range in g.objects(prop, RDFS["range"]):
+                self.data_ranges.setdefault(prop, []).append(data_range)
+
+    def _add_disjoint(self, classes: list[Node]) -> None:
+        for cls in classes:
+            self.disjoint.setdefault(cls, set()).update(other for other in classes if other != cls)
+
+    def _in_range(self, literal: Literal, data_range: Node) -> bool | None:
+        """
+        Whether a literal is in a data range, None when the range is not understood.
+        """
+        g = self.ontology
+
+        if data_range == RDFS["Literal"]:
+            return True
+
+        if isinstance(data_range, URIRef):
+            if data_range == RDF["PlainLiteral"]:
+                return _datatype(literal) in (XSD["string"], RDF["langString"])
+
+            datatype = _datatype(literal)
+
+            while datatype is not None:
+                if datatype == data_range:
+                    return True
+                datatype = XSD_PARENT.get(datatype)
+
+            value = _numeric(literal)
+
+            # An integer value may still be in a narrower integer datatype.
+            if value is not None and data_range in INTEGER_BOUNDS:
+                if value != value.to_integral_value():
+                    return False
+                low, high = INTEGER_BOUNDS[data_range]
+                return (low is None or value >= low) and (high is None or value <= high)
+
+            # Reasoners differ on plain strings in rdf:langString, let a reasoner decide.
+            if data_range == RDF["langString"] and _datatype(literal) == XSD["string"]:
+                return None
+
+            if data_range.startswith(str(XSD)) or data_range == RDF["langString"]:
+                return False
+
+            # Datatype defined in the ontology
+            definition = g.value(data_range, OWL["equivalentClass"])
+            if definition is not None:
+                return self._in_range(literal, definition)
+
+            return None
+
+        members = g.value(data_range, OWL["oneOf"])
+        if members is not None:
+            return any(literal.eq(member) for member in Collection(g, members))
+
+        members = g.value(data_range, OWL["unionOf"])
+        if members is not None:
+            results = [self._in_range(literal, member) for member in Collection(g, members)]
+            return True if True in results else None if None in results else False
+
+        base = g.value(data_range, OWL["onDatatype"])
+        if base is not None:
+            inside = self._in_range(literal, base)
+            value = _numeric(literal)
+
+            if inside is not True or value is None:
+                return inside
+
+            for restriction in Collection(g, g.value(data_range, OWL["withRestrictions"])):
+                for facet, bound in g.predicate_objects(restriction):
+                    if facet not in FACETS:
+                        return None
+                    if not FACETS[facet](value, Decimal(str(bound.value))):
+                        return False
+
+            return True
+
+        return None
+
+    def detect(self, graph: Graph) -> tuple[list[Clash], bool]:
+        """
+        Return the clashes of an instance graph, and whether finding none settles it.
+        """
+        clashes = []
+        conclusive = True
+
+        for subj, pred, obj in graph:
+            if str(pred).startswith(str(OWL)) or (pred == RDF["type"] and str(obj).startswith(str(OWL)) and obj != OWL["NamedIndividual"]):
+                conclusive = False
+
+        materialized = materialize(graph, self.rules, declare_individuals=False)
+
+        types: dict[Node, set[Node]] = {}
+        for individual, cls in materialized.subject_objects(RDF["type"]):
+            types.setdefault(individual, set()).add(cls)
+
+        for individual, classes in types.items():
+            if OWL["Nothing"] in classes:
+                clashes.append(Clash("nothing", (individual,), f"{individual} is an instance of owl:Nothing"))
+
+            for cls in classes:
+                for other in self.disjoint.get(cls, set()) & classes:
+                    # Each pair is reported once.
+                    if str(cls) < str(other):
+                        clashes.append(Clash("disjoint", (individual,), f"{individual} is an instance of the disjoint classes {cls} and {other}"))
+
+            for cls in classes:
+                for prop, maximum in self.data_cardinalities.get(cls, ()):
+                    # Numbers are told apart by value, 1 and 1.0 are the same value.
+                    values = {
+                        value if _numeric(value) is None else _numeric(value)
+                        for value in materialized.objects(individual, prop)
+                        if isinstance(value, Literal)
+                    }
+                    if len(values) > maximum:
+                        clashes.append(Clash("cardinality", (individual,), f"{individual} has {len(values)} values of {prop}, {cls} allows {maximum}"))
+
+                for prop, maximum in self.object_cardinalities.get(cls, ()):
+                    if len(set(materialized.objects(individual, prop))) > maximum:
+                        conclusive = False
+
+        for prop, members, side in self.unions:
+            pairs = materialized.subject_objects(prop)
+
+            for individual in {subj if side == "domain" else obj for subj, obj in pairs}:
+                if isinstance(individual, Literal):
+                    continue
+
+                classes = types.get(individual, set())
+
+                if all(self.union_disjoint[member] & classes for member in members):
+                    clashes.append(Clash("union", (individual,), f"{individual} is outside every class of the {side} of {prop}"))
+
+        for prop, data_ranges in self.data_ranges.items():
+            for individual, value in materialized.subject_objects(prop):
+                if not isinstance(value, Literal):
+                    continue
+
+                if value.ill_typed:
+                    clashes.append(Clash("datatype", (individual,), f"{value!r} of {prop} on {individual} is ill-typed"))
+                    continue
+
+                for data_range in data_ranges:
+                    inside = self._in_range(value, data_range)
+
+                    if inside is None:
+                        conclusive = False
+                    elif not inside:
+                        clashes.append(Clash("datatype", (individual,), f"{value!r} of {prop} on {individual} is outside its range"))
+
+        return clashes, conclusive
@@ -0,0 +1,179 @@
+from pathlib import Path
+import select
+import subprocess
+import threading
+#
+from utils.metrics_utils import process_peak_rss
+
+# Java source for the resident reasoner, launched with the ROBOT jar on the classpath
+# so that the OWL API and HermiT classes are available without a separate build step.
+#
+SERVER_SOURCE = Path(__file__).parent / "java" / "ReasonerServer.java"
+
+
+class ReasonerDaemon:
+    """
+    Keep a JVM with the DwC-OWL TBox loaded and send it reasoning requests.
+
+    The JVM keeps its reasoners over the TBox between requests, see
+    utils/java/ReasonerServer.java. HermiT still preprocesses the TBox
+    along with the data of every request.
+
+    The process is started lazily on the first request and restarted if it
+    dies. Requests are serialized with a lock, so a single daemon can be
+    shared between threads.
+
+    A request, or the start, taking longer than timeout seconds raises
+    TimeoutError. The JVM is killed then, and the next request starts a
+    new one.
+    """
+
+    def __init__(
+        self,
+        ontology_url: str,
+        robot_jar: str = "jarfiles/robot.jar",
+        java: str = "java",
+        jvm_args: list[str] | None = None,
+        timeout: float | None = 600,
+    ) -> None:
+        self.ontology_url = ontology_url
+        self.robot_jar = robot_jar
+        self.java = java
+        self.jvm_args = jvm_args or []
+        self.timeout = timeout
+        self._process: subprocess.Popen | None = None
+        self._lock = threading.Lock()
+
+    def start(self) -> None:
+        if self._process is not None and self._process.poll() is None:
+            return
+
+        self._process = subprocess.Popen(
+            [
+                self.java,
+                *self.jvm_args,
+                "-cp",
+                self.robot_jar,
+                str(SERVER_SOURCE),
+                self.ontology_url,
+            ],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            text=True,
+            bufsize=1,
+        )
+
+        # The server announces itself once the TBox has been parsed.
+        ready = self._readline().strip()
+
+        if ready != "READY":
+            self.close()
+            raise RuntimeError(f"Reasoner daemon failed to start for {self.ontology_url}")
+
+    def reason(
+        self,
+        input_path: Path,
+        output_path: Path,
+        reasoner: str = "hermit",
+        axiom_generators: list[str] = ["ClassAssertion", "PropertyAssertion"],
+        include_subclasses: bool = True,
+    ) -> None:
+        request = "\t".join(
+            [
+                "REASON",
+                reasoner,
+                "true" if include_subclasses else "false",
+                " ".join(axiom_generators),
+                str(input_path),
+                str(output_path),
+            ]
+        )
+
+        reply = self._request(request)
+
+        if reply != "OK":
+            raise RuntimeError(reply.partition("\t")[2] or reply)
+
+    def check(
+        self,
+        input_path: Path,
+        reasoner: str = "hermit",
+    ) -> bool:
+        """
+        Tell whether the data at input_path is consistent with the TBox.
+        """
+        reply = self._request("\t".join(["CHECK", reasoner, str(input_path)]))
+        status, _, detail = reply.partition("\t")
+
+        if status != "OK":
+            raise RuntimeError(detail or reply)
+
+        return detail == "consistent"
+
+    def _request(self, request: str) -> str:
+        with self._lock:
+            self.start()
+
+            self._process.stdin.write(request + "\n")
+            self._process.stdin.flush()
+
+            reply = self._readline().rstrip("\n")
+
+        if not reply:
+            raise RuntimeError("Reasoner daemon exited while handling a request")
+
+        return reply
+
+    def _readline(self) -> str:
+        # Replies are single lines, so nothing is ever left in the buffer of
+        # stdout between two of them and the pipe itself can be waited on.
+        ready, _, _ = select.select([self._process.stdout], [], [], self.timeout)
+
+        if not ready:
+            self.kill()
+            raise TimeoutError(f"Reasoner daemon for {self.ontology_url} did not answer within {self.timeout} s")
+
+        return self._process.stdout.readline()
+
+    def peak_rss(self) -> int | None:
+        """
+        Peak RSS of the running JVM in bytes, see utils/metrics_utils.py.
+        """
+        if self._process is None:
+            return None
+
+        return process_peak_rss(self._process.pid)
+
+    def kill(self) -> None:
+        """
+        Stop the JVM at once, without waiting for the request it handles.
+        """
+        if self._process is None:
+            return
+
+        process, self._process = self._process, None
+        process.kill()
+        process.wait()
+
+    def close(self) -> None:
+        if self._process is None:
+            return
+
+        process, self._process = self._process, None
+
+        if process.poll() is None:
+            try:
+                process.stdin.write("QUIT\n")
+                process.stdin.flush()
+                process.wait(timeout=10)
+            except (BrokenPipeError, subprocess.TimeoutExpired):
+                process.kill()
+                process.wait()
+
+    def __enter__(self) -> "ReasonerDaemon":
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
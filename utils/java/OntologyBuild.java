@@ -0,0 +1,83 @@
+import java.io.File;
+import java.io.FileOutputStream;
+import java.io.OutputStreamWriter;
+import java.io.PrintWriter;
+import java.nio.charset.StandardCharsets;
+
+import org.semanticweb.HermiT.Configuration;
+import org.semanticweb.HermiT.Reasoner;
+import org.semanticweb.owlapi.apibinding.OWLManager;
+import org.semanticweb.owlapi.formats.TurtleDocumentFormat;
+import org.semanticweb.owlapi.model.IRI;
+import org.semanticweb.owlapi.model.OWLDocumentFormat;
+import org.semanticweb.owlapi.model.OWLOntology;
+import org.semanticweb.owlapi.model.OWLOntologyManager;
+import org.semanticweb.owlapi.reasoner.InferenceType;
+
+/**
+ * One JVM for the OWL API steps of the build in main.py.
+ *
+ * The ontology written by rdflib is parsed once, then:
+ *
+ *     1. saved again as Turtle by the OWL API, like "robot convert" does,
+ *     2. clausified by HermiT, the DL clauses written like "HermiT.jar --dump-clauses" does,
+ *     3. classified by HermiT, the class, object property and data property
+ *        hierarchies written like "HermiT.jar -cOD" prints them.
+ *
+ * When the ontology is inconsistent there is no hierarchy, the classification
+ * file is left empty. The exit status is only nonzero when a step failed.
+ *
+ * Run with the ROBOT jar on the classpath (Java 11+ source launcher):
+ *
+ *     java -cp jarfiles/robot.jar utils/java/OntologyBuild.java ontology/dwc-owl.ttl \
+ *         ontology/dwc-owl-v2.ttl ontology/clauses.txt ontology/classification.txt
+ */
+public class OntologyBuild {
+
+    private static PrintWriter writer(String path) throws Exception {
+        return new PrintWriter(new OutputStreamWriter(new FileOutputStream(path), StandardCharsets.UTF_8));
+    }
+
+    public static void main(String[] args) throws Exception {
+        if (args.length != 4) {
+            System.err.println("Usage: OntologyBuild <input> <converted> <clauses> <classification>");
+            System.exit(2);
+        }
+
+        OWLOntologyManager manager = OWLManager.createOWLOntologyManager();
+        OWLOntology ontology = manager.loadOntologyFromOntologyDocument(new File(args[0]));
+
+        // Keep the prefixes of the input, as ROBOT does.
+        TurtleDocumentFormat turtle = new TurtleDocumentFormat();
+        OWLDocumentFormat inputFormat = manager.getOntologyFormat(ontology);
+        if (inputFormat != null && inputFormat.isPrefixOWLDocumentFormat()) {
+            turtle.copyPrefixesFrom(inputFormat.asPrefixOWLDocumentFormat());
+        }
+        manager.saveOntology(ontology, turtle, IRI.create(new File(args[1])));
+
+        Configuration configuration = new Configuration();
+        configuration.throwInconsistentOntologyException = false;
+        Reasoner hermit = new Reasoner(configuration, ontology);
+
+        try (PrintWriter clauses = writer(args[2])) {
+            clauses.println(hermit.getDLOntology().toString(hermit.getPrefixes()));
+        }
+
+        try (PrintWriter classification = writer(args[3])) {
+            if (hermit.isConsistent()) {
+                hermit.precomputeInferences(
+                    InferenceType.CLASS_HIERARCHY,
+                    InferenceType.OBJECT_PROPERTY_HIERARCHY,
+                    InferenceType.DATA_PROPERTY_HIERARCHY
+                );
+                hermit.printHierarchies(classification, true, false, false);
+                hermit.printHierarchies(classification, false, true, false);
+                hermit.printHierarchies(classification, false, false, true);
+            } else {
+                System.err.println("Ontology is inconsistent, no classification written");
+            }
+        } finally {
+            hermit.dispose();
+        }
+    }
+}
@@ -0,0 +1,280 @@
+import java.io.BufferedReader;
+import java.io.File;
+import java.io.InputStreamReader;
+import java.io.PrintStream;
+import java.nio.charset.StandardCharsets;
+import java.util.ArrayList;
+import java.util.HashMap;
+import java.util.HashSet;
+import java.util.List;
+import java.util.Map;
+import java.util.Set;
+
+import org.semanticweb.owlapi.apibinding.OWLManager;
+import org.semanticweb.owlapi.formats.NTriplesDocumentFormat;
+import org.semanticweb.owlapi.formats.RDFXMLDocumentFormat;
+import org.semanticweb.owlapi.formats.TurtleDocumentFormat;
+import org.semanticweb.owlapi.io.FileDocumentSource;
+import org.semanticweb.owlapi.model.IRI;
+import org.semanticweb.owlapi.model.OWLAxiom;
+import org.semanticweb.owlapi.model.OWLClass;
+import org.semanticweb.owlapi.model.OWLDataFactory;
+import org.semanticweb.owlapi.model.OWLDocumentFormat;
+import org.semanticweb.owlapi.model.OWLNamedIndividual;
+import org.semanticweb.owlapi.model.OWLOntology;
+import org.semanticweb.owlapi.model.OWLOntologyManager;
+import org.semanticweb.owlapi.model.parameters.Imports;
+import org.semanticweb.owlapi.reasoner.OWLReasoner;
+import org.semanticweb.owlapi.reasoner.OWLReasonerFactory;
+import org.semanticweb.owlapi.reasoner.structural.StructuralReasonerFactory;
+import org.semanticweb.owlapi.util.InferredAxiomGenerator;
+import org.semanticweb.owlapi.util.InferredDisjointClassesAxiomGenerator;
+import org.semanticweb.owlapi.util.InferredEquivalentClassAxiomGenerator;
+import org.semanticweb.owlapi.util.InferredInverseObjectPropertiesAxiomGenerator;
+import org.semanticweb.owlapi.util.InferredObjectPropertyCharacteristicAxiomGenerator;
+import org.semanticweb.owlapi.util.InferredPropertyAssertionGenerator;
+import org.semanticweb.owlapi.util.InferredSubClassAxiomGenerator;
+import org.semanticweb.owlapi.util.InferredSubObjectPropertyAxiomGenerator;
+
+/**
+ * Long-lived reasoner process used by utils/daemon_utils.py.
+ *
+ * The TBox given as the first argument is parsed once at startup. Requests
+ * are then read from stdin, one per line, as tab-separated fields:
+ *
+ *     REASON  reasoner  include-indirect  generators  input  output
+ *     CHECK   reasoner  input
+ *     QUIT
+ *
+ * The TBox is kept in a single ontology, with one reasoner per engine over
+ * it, created on first use and kept between requests. The axioms of each
+ * request are added to that ontology, and removed once it is answered; the
+ * reasoners see both changes at their next flush(). Engines that update
+ * incrementally, like ELK for assertions, only process the change. HermiT
+ * preprocesses the whole ontology again on every flush(), so with HermiT
+ * what is saved is the JVM start and the parsing of the TBox only.
+ *
+ * The output ontology holds the input axioms plus the inferred axioms, but
+ * not the preloaded TBox. Files ending in .nt are read and written as
+ * N-Triples, and may be named pipes. Each request is answered on stdout
+ * with a single "OK" or "ERROR<TAB>message" line. CHECK only tells whether
+ * the input is consistent with the TBox, answering "OK<TAB>consistent" or
+ * "OK<TAB>inconsistent".
+ *
+ * Run with the ROBOT jar on the classpath (Java 11+ source launcher):
+ *
+ *     java -cp jarfiles/robot.jar utils/java/ReasonerServer.java ontology/dwc-owl-v2.ttl
+ */
+public class ReasonerServer {
+
+    private final OWLOntologyManager manager = OWLManager.createOWLOntologyManager();
+    private final OWLDataFactory factory = manager.getOWLDataFactory();
+    // The TBox, plus the axioms of the request being handled.
+    private final OWLOntology workspace;
+    private final Map<String, OWLReasoner> reasoners = new HashMap<>();
+
+    public ReasonerServer(String tboxLocation) throws Exception {
+        workspace = manager.loadOntologyFromOntologyDocument(toIRI(tboxLocation));
+    }
+
+    private static IRI toIRI(String location) {
+        if (location.contains("://") || location.startsWith("file:")) {
+            return IRI.create(location);
+        }
+        return IRI.create(new File(location));
+    }
+
+    private static OWLReasonerFactory reasonerFactory(String name) throws Exception {
+        switch (name.toLowerCase()) {
+            case "hermit":
+                return new org.semanticweb.HermiT.ReasonerFactory();
+            case "elk":
+                return (OWLReasonerFactory) Class.forName("org.semanticweb.elk.owlapi.ElkReasonerFactory")
+                    .getDeclaredConstructor().newInstance();
+            case "structural":
+                return new StructuralReasonerFactory();
+            default:
+                throw new IllegalArgumentException("Unsupported reasoner: " + name);
+        }
+    }
+
+    private static OWLDocumentFormat outputFormat(String output) {
+        if (output.endsWith(".nt")) {
+            return new NTriplesDocumentFormat();
+        }
+        if (output.endsWith(".owl") || output.endsWith(".rdf")) {
+            return new RDFXMLDocumentFormat();
+        }
+        return new TurtleDocumentFormat();
+    }
+
+    private Set<OWLAxiom> inferAxioms(OWLReasoner reasoner, OWLOntology ontology, boolean includeIndirect, String generators) {
+        Set<OWLAxiom> inferred = new HashSet<>();
+        List<InferredAxiomGenerator<? extends OWLAxiom>> others = new ArrayList<>();
+
+        for (String generator : generators.trim().split("\\s+")) {
+            switch (generator) {
+                case "":
+                    break;
+                case "ClassAssertion":
+                    // Done by hand so that indirect types can be included, like ROBOT does.
+                    for (OWLNamedIndividual individual : ontology.getIndividualsInSignature(Imports.INCLUDED)) {
+                        for (OWLClass type : reasoner.getTypes(individual, !includeIndirect).getFlattened()) {
+                            if (!type.isOWLThing()) {
+                                inferred.add(factory.getOWLClassAssertionAxiom(type, individual));
+                            }
+                        }
+                    }
+                    break;
+                case "PropertyAssertion":
+                    others.add(new InferredPropertyAssertionGenerator());
+                    break;
+                case "SubClass":
+                    others.add(new InferredSubClassAxiomGenerator());
+                    break;
+                case "EquivalentClass":
+                    others.add(new InferredEquivalentClassAxiomGenerator());
+                    break;
+                case "DisjointClasses":
+                    others.add(new InferredDisjointClassesAxiomGenerator());
+                    break;
+                case "SubObjectProperty":
+                    others.add(new InferredSubObjectPropertyAxiomGenerator());
+                    break;
+                case "InverseObjectProperties":
+                    others.add(new InferredInverseObjectPropertiesAxiomGenerator());
+                    break;
+                case "ObjectPropertyCharacteristic":
+                    others.add(new InferredObjectPropertyCharacteristicAxiomGenerator());
+                    break;
+                default:
+                    throw new IllegalArgumentException("Unsupported axiom generator: " + generator);
+            }
+        }
+
+        for (InferredAxiomGenerator<? extends OWLAxiom> generator : others) {
+            inferred.addAll(generator.createAxioms(factory, reasoner));
+        }
+
+        return inferred;
+    }
+
+    private OWLOntology loadData(String input) throws Exception {
+        // With the format given up front the OWL API parses the input once, which
+        // lets it be a named pipe; otherwise it may reopen it to sniff the format.
+        return input.endsWith(".nt")
+            ? manager.loadOntologyFromOntologyDocument(new FileDocumentSource(new File(input), new NTriplesDocumentFormat()))
+            : manager.loadOntologyFromOntologyDocument(new File(input));
+    }
+
+    private OWLReasoner reasoner(String name) throws Exception {
+        OWLReasoner reasoner = reasoners.get(name.toLowerCase());
+
+        if (reasoner == null) {
+            // Buffering, changes to the workspace wait for the next flush().
+            reasoner = reasonerFactory(name).createReasoner(workspace);
+            reasoners.put(name.toLowerCase(), reasoner);
+        }
+
+        return reasoner;
+    }
+
+    private Set<OWLAxiom> addToWorkspace(Set<OWLAxiom> axioms) {
+        // Axioms the TBox already has stay when the request is done.
+        Set<OWLAxiom> added = new HashSet<>();
+
+        for (OWLAxiom axiom : axioms) {
+            if (!workspace.containsAxiom(axiom)) {
+                added.add(axiom);
+            }
+        }
+
+        manager.addAxioms(workspace, added);
+        return added;
+    }
+
+    private Set<OWLAxiom> readData(String input) throws Exception {
+        OWLOntology data = loadData(input);
+
+        try {
+            return new HashSet<>(data.getAxioms());
+        } finally {
+            manager.removeOntology(data);
+        }
+    }
+
+    private boolean check(String reasonerName, String input) throws Exception {
+        OWLReasoner reasoner = reasoner(reasonerName);
+        Set<OWLAxiom> added = addToWorkspace(readData(input));
+
+        try {
+            reasoner.flush();
+            return reasoner.isConsistent();
+        } finally {
+            manager.removeAxioms(workspace, added);
+        }
+    }
+
+    private void reason(String reasonerName, boolean includeIndirect, String generators, String input, String output) throws Exception {
+        OWLReasoner reasoner = reasoner(reasonerName);
+        Set<OWLAxiom> dataAxioms = readData(input);
+        Set<OWLAxiom> added = addToWorkspace(dataAxioms);
+
+        try {
+            reasoner.flush();
+
+            if (!reasoner.isConsistent()) {
+                throw new IllegalStateException("Ontology is inconsistent");
+            }
+
+            Set<OWLAxiom> inferred = inferAxioms(reasoner, workspace, includeIndirect, generators);
+
+            OWLOntology out = manager.createOntology();
+            manager.addAxioms(out, dataAxioms);
+            manager.addAxioms(out, inferred);
+            manager.saveOntology(out, outputFormat(output), IRI.create(new File(output)));
+            manager.removeOntology(out);
+        } finally {
+            manager.removeAxioms(workspace, added);
+        }
+    }
+
+    public static void main(String[] args) throws Exception {
+        if (args.length != 1) {
+            System.err.println("Usage: ReasonerServer <tbox>");
+            System.exit(2);
+        }
+
+        // Keep stdout for the protocol only, the OWL API logs to stderr.
+        PrintStream protocol = new PrintStream(System.out, true, "UTF-8");
+        System.setOut(System.err);
+
+        ReasonerServer server = new ReasonerServer(args[0]);
+        protocol.println("READY");
+
+        BufferedReader in = new BufferedReader(new InputStreamReader(System.in, StandardCharsets.UTF_8));
+        String line;
+
+        while ((line = in.readLine()) != null) {
+            String[] fields = line.split("\t", -1);
+
+            if (fields[0].equals("QUIT")) {
+                break;
+            }
+
+            try {
+                if (fields[0].equals("REASON") && fields.length == 6) {
+                    server.reason(fields[1], Boolean.parseBoolean(fields[2]), fields[3], fields[4], fields[5]);
+                    protocol.println("OK");
+                } else if (fields[0].equals("CHECK") && fields.length == 3) {
+                    protocol.println(server.check(fields[1], fields[2]) ? "OK\tconsistent" : "OK\tinconsistent");
+                } else {
+                    throw new IllegalArgumentException("Malformed request: " + line);
+                }
+            } catch (Exception e) {
+                String message = String.valueOf(e.getMessage()).replace('\n', ' ').replace('\t', ' ');
+                protocol.println("ERROR\t" + e.getClass().getSimpleName() + ": " + message);
+            }
+        }
+    }
+}
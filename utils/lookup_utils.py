@@ -0,0 +1,189 @@
+from decimal import Decimal
+from pathlib import Path
+from rdflib import BNode, Graph, Literal, Node, URIRef
+from rdflib.collection import Collection
+from rdflib.namespace import OWL, RDF, RDFS, SKOS
+
+# Kinds of the terms, by the first of their types found in this order.
+#
+KINDS = [
+    (OWL["Class"], "class"),
+    (OWL["ObjectProperty"], "object_property"),
+    (OWL["DatatypeProperty"], "datatype_property"),
+    (OWL["AnnotationProperty"], "annotation_property"),
+    (RDFS["Datatype"], "datatype"),
+    (SKOS["ConceptScheme"], "concept_scheme"),
+    (SKOS["Concept"], "concept"),
+    (OWL["NamedIndividual"], "individual"),
+    (OWL["Ontology"], "ontology"),
+]
+
+CARDINALITIES = {
+    OWL["cardinality"]: "exact",
+    OWL["minCardinality"]: "min",
+    OWL["maxCardinality"]: "max",
+    OWL["qualifiedCardinality"]: "exact",
+    OWL["minQualifiedCardinality"]: "min",
+    OWL["maxQualifiedCardinality"]: "max",
+}
+
+
+def _members(graph: Graph, node: Node) -> list[Node]:
+    # A class or datatype, the members of a union expanded, unions within unions as well.
+    members = graph.value(node, OWL["unionOf"]) if isinstance(node, BNode) else None
+
+    if members is None:
+        return [node]
+
+    return [member for item in Collection(graph, members) for member in _members(graph, item)]
+
+
+def _value(literal: Literal) -> object:
+    # Numbers as numbers, anything else as its lexical form.
+    value = literal.toPython()
+
+    return value if isinstance(value, (int, float, Decimal)) and not isinstance(value, bool) else str(literal)
+
+
+def lookup_tables(graph: Graph) -> dict[str, dict]:
+    """
+    Gather what validators and mappers look up about the terms of the ontology, keyed by IRI.
+
+    - KIND: "class", "object_property", "datatype_property", ... see KINDS,
+    - DOMAINS and RANGES: the named classes or datatypes, the members of
+      unions expanded, and the datatype a facet restriction is on,
+    - INVERSES: the inverse of an object property, both ways,
+    - SUPER_PROPERTIES: every super-property, not only the direct ones,
+    - PROPERTY_CHAINS: the chains of an object property, as tuples,
+    - CARDINALITIES: the restrictions of a class, as (property, "exact",
+      "min" or "max", count, qualifying class or None) tuples,
+    - ENUMERATIONS: the individuals of a class, or the literal values of a
+      datatype property, it is restricted to with owl:oneOf,
+    - FACETS: the datatype and (facet, value) pairs a datatype property is
+      restricted to with owl:withRestrictions.
+
+    Anonymous classes but unions are left out.
+    """
+    g = graph
+    tables: dict[str, dict] = {
+        "KIND": {},
+        "DOMAINS": {},
+        "RANGES": {},
+        "INVERSES": {},
+        "SUPER_PROPERTIES": {},
+        "PROPERTY_CHAINS": {},
+        "CARDINALITIES": {},
+        "ENUMERATIONS": {},
+        "FACETS": {},
+    }
+
+    for rdf_type, kind in reversed(KINDS):
+        for term in g.subjects(RDF["type"], rdf_type):
+            if isinstance(term, URIRef):
+                tables["KIND"][str(term)] = kind
+
+    for name, pred in (("DOMAINS", RDFS["domain"]), ("RANGES", RDFS["range"])):
+        for prop, cls in g.subject_objects(pred):
+            members = _members(g, cls)
+
+            for member in members:
+                datatype = g.value(member, OWL["onDatatype"]) if isinstance(member, BNode) else None
+                member = member if datatype is None else datatype
+
+                if isinstance(member, URIRef):
+                    tables[name].setdefault(str(prop), set()).add(str(member))
+
+            for member in members:
+                if not isinstance(member, BNode):
+                    continue
+
+                one_of = g.value(member, OWL["oneOf"])
+                if one_of is not None:
+                    tables["ENUMERATIONS"][str(prop)] = tuple(_value(value) if isinstance(value, Literal) else str(value) for value in Collection(g, one_of))
+
+                restrictions = g.value(member, OWL["withRestrictions"])
+                if restrictions is not None:
+                    facets = tuple(
+                        (str(facet), _value(bound))
+                        for restriction in Collection(g, restrictions)
+                        for facet, bound in g.predicate_objects(restriction)
+                    )
+                    tables["FACETS"][str(prop)] = (str(g.value(member, OWL["onDatatype"])), facets)
+
+    for prop, inverse in g.subject_objects(OWL["inverseOf"]):
+        tables["INVERSES"][str(prop)] = str(inverse)
+        tables["INVERSES"].setdefault(str(inverse), str(prop))
+
+    for prop in set(g.subjects(RDFS["subPropertyOf"])):
+        if isinstance(prop, URIRef):
+            supers = {str(node) for node in g.transitive_objects(prop, RDFS["subPropertyOf"]) if node != prop}
+            tables["SUPER_PROPERTIES"][str(prop)] = supers
+
+    for prop, chain in g.subject_objects(OWL["propertyChainAxiom"]):
+        tables["PROPERTY_CHAINS"].setdefault(str(prop), []).append(tuple(str(link) for link in Collection(g, chain)))
+
+    for cls, restriction in g.subject_objects(RDFS["subClassOf"]):
+        if not isinstance(cls, URIRef) or (restriction, RDF["type"], OWL["Restriction"]) not in g:
+            continue
+
+        for pred, kind in CARDINALITIES.items():
+            count = g.value(restriction, pred)
+
+            if count is not None:
+                on_class = g.value(restriction, OWL["onClass"]) or g.value(restriction, OWL["onDataRange"])
+                tables["CARDINALITIES"].setdefault(str(cls), []).append(
+                    (str(g.value(restriction, OWL["onProperty"])), kind, int(count), None if on_class is None else str(on_class))
+                )
+
+    for cls, one_of in g.subject_objects(OWL["oneOf"]):
+        if isinstance(cls, URIRef):
+            tables["ENUMERATIONS"][str(cls)] = tuple(str(value) for value in Collection(g, one_of))
+
+    # Frozen, and in order so that the same ontology gives the same module.
+    for name in ("DOMAINS", "RANGES", "SUPER_PROPERTIES"):
+        tables[name] = {key: frozenset(value) for key, value in tables[name].items()}
+
+    for name in ("PROPERTY_CHAINS", "CARDINALITIES"):
+        tables[name] = {key: tuple(sorted(value, key=repr)) for key, value in tables[name].items()}
+
+    return tables
+
+
+def _format(value: object, indent: str = "") -> str:
+    if isinstance(value, dict):
+        if not value:
+            return "{}"
+        inner = indent + "    "
+        items = [f"{inner}{key!r}: {_format(value[key], inner)}," for key in sorted(value)]
+        return "{\n" + "\n".join(items) + f"\n{indent}}}"
+
+    if isinstance(value, frozenset):
+        return f"frozenset({{{', '.join(repr(item) for item in sorted(value))}}})" if value else "frozenset()"
+
+    if isinstance(value, tuple):
+        items = [_format(item, indent) for item in value]
+        return f"({items[0]},)" if len(items) == 1 else f"({', '.join(items)})"
+
+    return repr(value)
+
+
+def write_lookup_module(graph: Graph, path: str | Path) -> None:
+    """
+    Write the lookup tables of the ontology as a Python module of plain dicts, frozensets and tuples.
+    """
+    lines = [
+        '"""',
+        "Lookup tables of the Darwin Core OWL ontology, keyed by IRI.",
+        "",
+        "Generated by utils/lookup_utils.py when the ontology is built, do not edit.",
+        "See lookup_tables() there for what each table holds.",
+        '"""',
+        "",
+        "from decimal import Decimal",
+        "",
+    ]
+
+    for name, table in lookup_tables(graph).items():
+        lines += ["", f"{name} = {_format(table)}", ""]
+
+    Path(path).write_text("\n".join(lines), encoding="utf-8")
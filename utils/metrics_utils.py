@@ -0,0 +1,104 @@
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Callable
+import os
+import subprocess
+import time
+from rdflib import BNode, Graph
+
+
+@dataclass
+class ReasoningMetrics:
+    """
+    What one reasoning call spent, phase by phase.
+
+    Phases are named after the step they time: "prepare", "cache",
+    "serialize", "reason", "parse", "describe". With the ROBOT command line,
+    "reason" includes the JVM startup. Wall and CPU times are in seconds,
+    the CPU time being that of this whole process. The child figures are
+    those of the reasoner process, the daemon peak covering its lifetime.
+    """
+
+    wall: dict[str, float] = field(default_factory=dict)
+    cpu: dict[str, float] = field(default_factory=dict)
+    child_cpu: float | None = None
+    child_peak_rss: int | None = None
+    triples_in: int = 0
+    triples_out: int = 0
+    inferred: int = 0
+    cache_hit: bool | None = None
+
+    @contextmanager
+    def phase(self, name: str):
+        wall, cpu = time.perf_counter(), time.process_time()
+
+        try:
+            yield
+        finally:
+            self.wall[name] = self.wall.get(name, 0.0) + time.perf_counter() - wall
+            self.cpu[name] = self.cpu.get(name, 0.0) + time.process_time() - cpu
+
+    @property
+    def total_wall(self) -> float:
+        return sum(self.wall.values())
+
+    @property
+    def total_cpu(self) -> float:
+        return sum(self.cpu.values())
+
+
+MetricsHook = Callable[[ReasoningMetrics], None]
+
+
+def count_inferred(graph_pre: Graph, graph_post: Graph) -> int:
+    """
+    Count the triples of graph_post missing from graph_pre.
+
+    Triples with blank nodes are left aside, the reasoner relabels them.
+    """
+    return sum(
+        1
+        for triple in graph_post
+        if not any(isinstance(node, BNode) for node in triple) and triple not in graph_pre
+    )
+
+
+def run_measured(args: list, metrics: ReasoningMetrics | None = None, **kwargs) -> int:
+    """
+    Run a command to completion like subprocess.run and return its exit code.
+
+    The CPU time and peak RSS of the child are read from its resource
+    usage when it is reaped, and stored in metrics.
+    """
+    process = subprocess.Popen(args, **kwargs)
+
+    try:
+        _, status, usage = os.wait4(process.pid, 0)
+    except BaseException:
+        process.kill()
+        process.wait()
+        raise
+
+    process.returncode = os.waitstatus_to_exitcode(status)
+
+    if metrics is not None:
+        metrics.child_cpu = usage.ru_utime + usage.ru_stime
+        # ru_maxrss is in kilobytes on Linux
+        metrics.child_peak_rss = usage.ru_maxrss * 1024
+
+    return process.returncode
+
+
+def process_peak_rss(pid: int) -> int | None:
+    """
+    Return the peak RSS of a running process in bytes, when /proc has it.
+    """
+    try:
+        with open(f"/proc/{pid}/status") as status:
+            for line in status:
+                if line.startswith("VmHWM:"):
+                    return int(line.split()[1]) * 1024
+    except OSError:
+        pass
+
+    return None
@@ -0,0 +1,367 @@
+from rdflib import BNode, Graph, Literal, Node, URIRef
+from rdflib.collection import Collection
+from rdflib.namespace import OWL, RDF, RDFS, XSD
+#
+from utils.swrl_utils import SWRL
+
+Triple = tuple[Node, URIRef, Node]
+
+# Terms of these vocabularies are never part of a signature.
+BUILTIN_NAMESPACES = tuple(str(namespace) for namespace in (OWL, RDF, RDFS, XSD, SWRL))
+
+DECLARATION_TYPES = {
+    OWL["Class"],
+    OWL["ObjectProperty"],
+    OWL["DatatypeProperty"],
+    OWL["AnnotationProperty"],
+    OWL["NamedIndividual"],
+    RDFS["Datatype"],
+}
+
+PROPERTY_CHARACTERISTICS = {
+    OWL["FunctionalProperty"],
+    OWL["InverseFunctionalProperty"],
+    OWL["TransitiveProperty"],
+    OWL["SymmetricProperty"],
+    OWL["AsymmetricProperty"],
+    OWL["ReflexiveProperty"],
+    OWL["IrreflexiveProperty"],
+}
+
+# Restrictions that need at least one filler, empty as soon as their property is.
+NONZERO_CARDINALITIES = (
+    OWL["minCardinality"],
+    OWL["cardinality"],
+    OWL["minQualifiedCardinality"],
+    OWL["qualifiedCardinality"],
+)
+
+
+def _builtin(node: Node) -> bool:
+    return isinstance(node, URIRef) and str(node).startswith(BUILTIN_NAMESPACES)
+
+
+def graph_signature(graph: Graph) -> set[URIRef]:
+    """
+    Collect the classes, properties and individuals used in a graph.
+    """
+    return {
+        node
+        for triple in graph
+        for node in triple
+        if isinstance(node, URIRef) and not _builtin(node)
+    }
+
+
+class _Axiom:
+    """
+    The triples of one axiom, the terms they use and a test telling
+    whether the axiom is local to a signature.
+    """
+
+    __slots__ = ("triples", "terms", "local")
+
+    def __init__(self, triples: list[Triple], local) -> None:
+        self.triples = triples
+        self.terms = {
+            node
+            for triple in triples
+            for node in triple
+            if isinstance(node, URIRef) and not _builtin(node)
+        }
+        self.local = local
+
+
+class ModuleExtractor:
+    """
+    Extract locality-based modules from an ontology.
+
+    The ontology is split into axioms once. A module for a signature holds
+    every axiom that is not ⊥-local to it, the signature growing with the
+    terms of each axiom taken in, so that reasoning over the module gives
+    the same entailments about the signature as the whole ontology.
+    Annotations are left out since they entail nothing.
+
+    Assertions about named individuals of the ontology are taken in when
+    an individual they mention is in the signature, instead of always as
+    strict ⊥-locality would have it. Otherwise every vocabulary concept
+    would end up in every module. Enumerations of named classes, owl:oneOf,
+    are never ⊥-local and are in every module along with their individuals.
+    """
+
+    def __init__(self, ontology: Graph) -> None:
+        self.ontology = ontology
+        self.datatypes = set(ontology.subjects(RDF["type"], RDFS["Datatype"]))
+        self.assertion_properties = set(ontology.subjects(RDF["type"], OWL["ObjectProperty"])) | set(
+            ontology.subjects(RDF["type"], OWL["DatatypeProperty"])
+        )
+        self.header: list[Triple] = [
+            (subj, RDF["type"], OWL["Ontology"]) for subj in ontology.subjects(RDF["type"], OWL["Ontology"])
+        ]
+        self.declarations: dict[Node, list[Triple]] = {}
+        self.axioms: list[_Axiom] = []
+        # n-ary disjointness and difference, with one axiom per member
+        self.groups: list[tuple[URIRef, URIRef, list[Node], range]] = []
+
+        for triple in ontology:
+            self._split(triple)
+
+    def _closure(self, node: Node) -> list[Triple]:
+        # Every triple hanging from a blank node: class expressions, lists, atoms.
+        triples = []
+        stack = [node]
+        seen = set()
+
+        while stack:
+            node = stack.pop()
+            if not isinstance(node, BNode) or node in seen:
+                continue
+            seen.add(node)
+
+            for _, pred, obj in self.ontology.triples((node, None, None)):
+                triples.append((node, pred, obj))
+                stack.append(obj)
+
+        return triples
+
+    def _axiom(self, triple: Triple, local) -> None:
+        subj, _, obj = triple
+        self.axioms.append(_Axiom([triple] + self._closure(subj) + self._closure(obj), local))
+
+    def _empty_property(self, prop: Node, sig: set[Node]) -> bool:
+        inverse = self.ontology.value(prop, OWL["inverseOf"]) if isinstance(prop, BNode) else None
+
+        if inverse is not None:
+            return self._empty_property(inverse, sig)
+
+        return isinstance(prop, URIRef) and prop not in sig and not _builtin(prop)
+
+    def _members(self, node: Node) -> list[Node]:
+        return list(Collection(self.ontology, node))
+
+    def _bottom(self, node: Node, sig: set[Node]) -> bool:
+        """
+        Whether a class expression is empty once terms outside sig are.
+        """
+        g = self.ontology
+
+        if isinstance(node, URIRef):
+            if node == OWL["Nothing"]:
+                return True
+            return node not in sig and node not in self.datatypes and not _builtin(node)
+
+        if not isinstance(node, BNode):
+            return False
+
+        members = g.value(node, OWL["intersectionOf"])
+        if members is not None:
+            return any(self._bottom(member, sig) for member in self._members(members))
+
+        members = g.value(node, OWL["unionOf"])
+        if members is not None:
+            return all(self._bottom(member, sig) for member in self._members(members))
+
+        complement = g.value(node, OWL["complementOf"])
+        if complement is not None:
+            return self._top(complement, sig)
+
+        prop = g.value(node, OWL["onProperty"])
+        if prop is None:
+            return False
+
+        filler = g.value(node, OWL["someValuesFrom"])
+        if filler is not None:
+            return self._empty_property(prop, sig) or self._bottom(filler, sig)
+
+        if (node, OWL["hasValue"], None) in g or (node, OWL["hasSelf"], None) in g:
+            return self._empty_property(prop, sig)
+
+        for cardinality in NONZERO_CARDINALITIES:
+            count = g.value(node, cardinality)
+            if isinstance(count, Literal) and int(count) > 0:
+                on_class = g.value(node, OWL["onClass"])
+                return self._empty_property(prop, sig) or (on_class is not None and self._bottom(on_class, sig))
+
+        return False
+
+    def _top(self, node: Node, sig: set[Node]) -> bool:
+        """
+        Whether a class expression holds everything once terms outside sig are empty.
+        """
+        g = self.ontology
+
+        if isinstance(node, URIRef):
+            return node == OWL["Thing"]
+
+        if not isinstance(node, BNode):
+            return False
+
+        members = g.value(node, OWL["intersectionOf"])
+        if members is not None:
+            return all(self._top(member, sig) for member in self._members(members))
+
+        members = g.value(node, OWL["unionOf"])
+        if members is not None:
+            return any(self._top(member, sig) for member in self._members(members))
+
+        complement = g.value(node, OWL["complementOf"])
+        if complement is not None:
+            return self._bottom(complement, sig)
+
+        prop = g.value(node, OWL["onProperty"])
+        if prop is None:
+            return False
+
+        if (node, OWL["allValuesFrom"], None) in g or (node, OWL["maxCardinality"], None) in g or (node, OWL["maxQualifiedCardinality"], None) in g:
+            return self._empty_property(prop, sig)
+
+        return False
+
+    def _rule_local(self, rule: Node, sig: set[Node]) -> bool:
+        # A rule is local when some body atom can never match.
+        for atom in self._members(self.ontology.value(rule, SWRL["body"])):
+            predicate = self.ontology.value(atom, SWRL["classPredicate"])
+            if predicate is not None and self._bottom(predicate, sig):
+                return True
+
+            predicate = self.ontology.value(atom, SWRL["propertyPredicate"])
+            if predicate is not None and self._empty_property(predicate, sig):
+                return True
+
+        return False
+
+    def _group(self, triple: Triple, list_pred: URIRef, local_member) -> None:
+        subj = triple[0]
+        members = self._members(self.ontology.value(subj, list_pred))
+        start = len(self.axioms)
+
+        # Each member is taken in when it and at least one other member are non-local.
+        for member in members:
+            def local(sig, member=member):
+                return local_member(member, sig) or sum(not local_member(other, sig) for other in members) < 2
+
+            self.axioms.append(_Axiom([(subj, RDF["type"], triple[2])] + self._closure(member), local))
+
+        self.groups.append((triple[2], list_pred, members, range(start, len(self.axioms))))
+
+    def _split(self, triple: Triple) -> None:
+        subj, pred, obj = triple
+        bottom, top, empty = self._bottom, self._top, self._empty_property
+
+        if pred == RDF["type"]:
+            if obj in DECLARATION_TYPES:
+                self.declarations.setdefault(subj, []).append(triple)
+            elif obj in PROPERTY_CHARACTERISTICS:
+                self._axiom(triple, lambda sig: empty(subj, sig))
+            elif obj == OWL["AllDisjointClasses"]:
+                self._group(triple, OWL["members"], bottom)
+            elif obj == OWL["AllDifferent"]:
+                list_pred = OWL["members"] if (subj, OWL["members"], None) in self.ontology else OWL["distinctMembers"]
+                self._group(triple, list_pred, lambda member, sig: member not in sig)
+            elif obj == SWRL["Imp"]:
+                self._axiom(triple, lambda sig: self._rule_local(subj, sig))
+            elif obj == OWL["NegativePropertyAssertion"]:
+                source = self.ontology.value(subj, OWL["sourceIndividual"])
+                self._axiom(triple, lambda sig: source not in sig)
+            elif isinstance(subj, URIRef) and obj != OWL["Ontology"]:
+                # Class assertion
+                self._axiom(triple, lambda sig: subj not in sig)
+        elif pred == RDFS["subClassOf"]:
+            self._axiom(triple, lambda sig: bottom(subj, sig) or top(obj, sig))
+        elif pred == OWL["equivalentClass"]:
+            if subj in self.datatypes:
+                self._axiom(triple, lambda sig: subj not in sig)
+            else:
+                self._axiom(triple, lambda sig: (bottom(subj, sig) and bottom(obj, sig)) or (top(subj, sig) and top(obj, sig)))
+        elif pred == OWL["oneOf"] and isinstance(subj, URIRef):
+            # A class made of nominals is never empty, so never ⊥-local. The
+            # enumerations of datatypes are part of the axioms using them.
+            self._axiom(triple, lambda sig: False)
+        elif pred == OWL["disjointWith"]:
+            self._axiom(triple, lambda sig: bottom(subj, sig) or bottom(obj, sig))
+        elif pred == OWL["hasKey"]:
+            self._axiom(triple, lambda sig: bottom(subj, sig))
+        elif pred in (RDFS["domain"], RDFS["range"]):
+            self._axiom(triple, lambda sig: empty(subj, sig) or top(obj, sig))
+        elif pred == RDFS["subPropertyOf"]:
+            self._axiom(triple, lambda sig: empty(subj, sig))
+        elif pred == OWL["propertyChainAxiom"]:
+            self._axiom(triple, lambda sig: any(empty(prop, sig) for prop in self._members(obj)))
+        elif pred in (OWL["equivalentProperty"], OWL["inverseOf"]) and isinstance(subj, URIRef):
+            self._axiom(triple, lambda sig: empty(subj, sig) and empty(obj, sig))
+        elif pred == OWL["propertyDisjointWith"]:
+            self._axiom(triple, lambda sig: empty(subj, sig) or empty(obj, sig))
+        elif pred == OWL["sameAs"]:
+            self._axiom(triple, lambda sig: subj not in sig and obj not in sig)
+        elif pred == OWL["differentFrom"]:
+            self._axiom(triple, lambda sig: subj not in sig or obj not in sig)
+        elif pred in self.assertion_properties and isinstance(subj, URIRef):
+            self._axiom(triple, lambda sig: subj not in sig and obj not in sig)
+        # Anything else is an annotation or part of the blank node structure
+        # of the axioms above.
+
+    def extract(self, signature: set[Node]) -> Graph:
+        """
+        Return the module of the ontology for the given signature.
+        """
+        sig = set(signature)
+        taken = [False] * len(self.axioms)
+        changed = True
+
+        # Signatures only grow, so an axiom taken in stays taken in.
+        while changed:
+            changed = False
+
+            for index, axiom in enumerate(self.axioms):
+                if taken[index] or axiom.local(sig):
+                    continue
+
+                taken[index] = True
+                sig |= axiom.terms
+                changed = True
+
+        module = Graph()
+
+        for prefix, namespace in self.ontology.namespaces():
+            module.bind(prefix, namespace)
+
+        for triple in self.header:
+            module.add(triple)
+
+        for term in sig:
+            for triple in self.declarations.get(term, ()):
+                module.add(triple)
+
+        grouped = {index for _, _, _, indexes in self.groups for index in indexes}
+
+        for index, axiom in enumerate(self.axioms):
+            if taken[index] and index not in grouped:
+                for triple in axiom.triples:
+                    module.add(triple)
+
+        # Groups are written back with the members taken in only.
+        for group_type, list_pred, members, indexes in self.groups:
+            kept = [member for member, index in zip(members, indexes) if taken[index]]
+
+            if len(kept) < 2:
+                continue
+
+            node = BNode()
+            module.add((node, RDF["type"], group_type))
+            module.add((node, list_pred, Collection(module, BNode(), kept).uri))
+
+            for member in kept:
+                for triple in self._closure(member):
+                    module.add(triple)
+
+        return module
+
+
+def extract_module(
+    ontology: Graph,
+    signature: set[Node],
+) -> Graph:
+    """
+    Return the ⊥-locality module of an ontology for a signature, see ModuleExtractor.
+    """
+    return ModuleExtractor(ontology).extract(signature)
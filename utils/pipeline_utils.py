@@ -0,0 +1,152 @@
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable
+import hashlib
+import json
+#
+from utils.profile_utils import BuildProfiler
+
+
+@dataclass
+class Stage:
+    """
+    A step of the build pipeline.
+
+    run returns whether the stage succeeded. inputs and outputs are paths or
+    glob patterns relative to the working directory, and after names the
+    stages whose outputs this one reads.
+    """
+
+    name: str
+    run: Callable[[], bool]
+    inputs: list[str]
+    outputs: list[str] = field(default_factory=list)
+    after: list[str] = field(default_factory=list)
+
+
+def inputs_digest(patterns: list[str]) -> str:
+    """
+    Hash the content of the files matching the patterns, and which patterns match nothing.
+    """
+    digest = hashlib.sha256()
+
+    for pattern in patterns:
+        paths = sorted(Path().glob(pattern))
+
+        if not paths:
+            digest.update(f"{pattern}\0missing\0".encode("utf-8"))
+
+        for path in paths:
+            digest.update(f"{path}\0".encode("utf-8"))
+            digest.update(path.read_bytes())
+
+    return digest.hexdigest()
+
+
+def load_state(state_path: str | Path) -> dict[str, str]:
+    """
+    Return the digests of the inputs the stages last succeeded on, by stage name.
+    """
+    state_path = Path(state_path)
+
+    return json.loads(state_path.read_text()) if state_path.exists() else {}
+
+
+def is_current(stage: Stage, state: dict[str, str], digest: str | None = None) -> bool:
+    """
+    Whether a stage already succeeded on its current inputs, and its outputs are still there.
+    """
+    if digest is None:
+        digest = inputs_digest(stage.inputs)
+
+    return state.get(stage.name) == digest and all(any(Path().glob(output)) for output in stage.outputs)
+
+
+def run_stages(
+    stages: list[Stage],
+    state_path: str | Path,
+    incremental: bool = False,
+    jobs: int = 1,
+    profiler: BuildProfiler | None = None,
+) -> dict[str, bool]:
+    """
+    Run the stages in worker threads, each one as soon as the stages it comes
+    after are done, and return which ones succeeded.
+
+    The digest of the inputs of every stage that succeeds is recorded in
+    state_path. When incremental, the stages that already ran on their
+    current inputs are skipped, which counts as a success. A stage raising
+    an exception fails, and a stage whose inputs are produced by a failed
+    stage does not run. With a profiler,
+    the stages run one at a time so that their figures do not mix.
+    """
+    state_path = Path(state_path)
+    state = load_state(state_path)
+    names = {stage.name for stage in stages}
+    results: dict[str, bool] = {}
+
+    if profiler is None:
+        profiler = BuildProfiler(enabled=False)
+    elif profiler.enabled:
+        jobs = 1
+
+    def run(stage: Stage) -> bool:
+        with profiler.stage(stage.name):
+            return stage.run()
+
+    pending = list(stages)
+    running = {}
+
+    with ThreadPoolExecutor(max_workers=jobs) as executor:
+        while pending or running:
+            for stage in list(pending):
+                upstream = [name for name in stage.after if name in names]
+
+                if not all(name in results for name in upstream):
+                    continue
+
+                pending.remove(stage)
+
+                if not all(results[name] for name in upstream):
+                    print(f"- {stage.name}: not run, an earlier stage failed")
+                    results[stage.name] = False
+                    continue
+
+                # Hashed once the stages before it are done, so their new outputs count.
+                digest = inputs_digest(stage.inputs)
+
+                if incremental and is_current(stage, state, digest):
+                    print(f"- {stage.name}: inputs unchanged, skipped")
+                    results[stage.name] = True
+                    continue
+
+                running[executor.submit(run, stage)] = (stage, digest)
+
+            if not running:
+                if pending and not any(all(name in results for name in stage.after if name in names) for stage in pending):
+                    raise ValueError(f"Stages waiting on each other: {', '.join(stage.name for stage in pending)}")
+                continue
+
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+
+            for future in done:
+                stage, digest = running.pop(future)
+
+                # A stage raising fails alone, the others still run and their state is saved.
+                try:
+                    results[stage.name] = future.result()
+                except Exception as e:
+                    print(f"- {stage.name}: failed, {type(e).__name__}: {e}")
+                    results[stage.name] = False
+
+                # A failed stage runs again next time.
+                if results[stage.name]:
+                    state[stage.name] = digest
+                else:
+                    state.pop(stage.name, None)
+
+                state_path.parent.mkdir(parents=True, exist_ok=True)
+                state_path.write_text(json.dumps(state, indent=2))
+
+    return results
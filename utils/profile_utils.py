@@ -0,0 +1,144 @@
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+import cProfile
+import json
+import resource
+import time
+import tracemalloc
+from rdflib import Graph
+
+
+@dataclass
+class StageProfile:
+    """
+    What one stage of the build spent.
+
+    Times are in seconds and memory in bytes. peak_memory is the peak of the
+    Python allocations traced during the stage, everything still allocated
+    from earlier stages included. The child figures are those of the
+    processes the stage ran, child_peak_rss being only known when it is
+    higher than that of the children of every earlier stage. triples is the
+    number of triples the stage added to the graph, when it builds one.
+    """
+
+    name: str
+    wall: float = 0.0
+    cpu: float = 0.0
+    peak_memory: int | None = None
+    child_cpu: float = 0.0
+    child_peak_rss: int | None = None
+    triples: int | None = None
+
+
+@dataclass
+class BuildProfiler:
+    """
+    Profile the stages of the ontology build, one after the other.
+
+    Disabled, stage() costs nothing. With an output_dir, every stage also
+    gets its cProfile statistics, <stage>.prof, and its largest allocations
+    according to tracemalloc, <stage>.tracemalloc.txt.
+    """
+
+    enabled: bool = True
+    output_dir: str | Path | None = None
+    stages: list[StageProfile] = field(default_factory=list)
+
+    @contextmanager
+    def stage(self, name: str, graph: Graph | None = None):
+        if not self.enabled:
+            yield
+            return
+
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(10 if self.output_dir is not None else 1)
+
+        profile = StageProfile(name)
+        profiler = cProfile.Profile() if self.output_dir is not None else None
+        triples = None if graph is None else len(graph)
+        children = resource.getrusage(resource.RUSAGE_CHILDREN)
+
+        tracemalloc.reset_peak()
+        wall, cpu = time.perf_counter(), time.process_time()
+
+        if profiler is not None:
+            profiler.enable()
+
+        try:
+            yield
+        finally:
+            if profiler is not None:
+                profiler.disable()
+
+            profile.wall = time.perf_counter() - wall
+            profile.cpu = time.process_time() - cpu
+            profile.peak_memory = tracemalloc.get_traced_memory()[1]
+
+            usage = resource.getrusage(resource.RUSAGE_CHILDREN)
+            profile.child_cpu = max(0.0, usage.ru_utime + usage.ru_stime - children.ru_utime - children.ru_stime)
+            # ru_maxrss is in kilobytes on Linux, and the highest of all children so far
+            if usage.ru_maxrss > children.ru_maxrss:
+                profile.child_peak_rss = usage.ru_maxrss * 1024
+
+            if graph is not None:
+                profile.triples = len(graph) - triples
+
+            self.stages.append(profile)
+
+            if profiler is not None:
+                self._write_stage_output(name, profiler)
+
+    def _write_stage_output(self, name: str, profiler: cProfile.Profile) -> None:
+        output_dir = Path(self.output_dir)
+        output_dir.mkdir(parents=True, exist_ok=True)
+        filename = name.replace("/", "-").replace(" ", "-")
+
+        profiler.dump_stats(output_dir / f"{filename}.prof")
+
+        statistics = tracemalloc.take_snapshot().statistics("traceback")
+        with open(output_dir / f"{filename}.tracemalloc.txt", "w") as f:
+            for statistic in statistics[:25]:
+                f.write(f"{statistic.size / 1024:.1f} KiB in {statistic.count} blocks\n")
+                for line in statistic.traceback.format():
+                    f.write(f"    {line}\n")
+
+    def report(self) -> str:
+        """
+        Format the profiles of the stages as a table.
+        """
+        def mib(size: int | None) -> str:
+            return "-" if size is None else f"{size / (1 << 20):.1f}"
+
+        rows = [("stage", "wall (s)", "cpu (s)", "peak (MiB)", "child cpu (s)", "child rss (MiB)", "triples")]
+
+        for profile in self.stages:
+            rows.append((
+                profile.name,
+                f"{profile.wall:.3f}",
+                f"{profile.cpu:.3f}",
+                mib(profile.peak_memory),
+                f"{profile.child_cpu:.3f}",
+                mib(profile.child_peak_rss),
+                "-" if profile.triples is None else str(profile.triples),
+            ))
+
+        rows.append((
+            "total",
+            f"{sum(profile.wall for profile in self.stages):.3f}",
+            f"{sum(profile.cpu for profile in self.stages):.3f}",
+            mib(max((profile.peak_memory or 0 for profile in self.stages), default=None)),
+            f"{sum(profile.child_cpu for profile in self.stages):.3f}",
+            mib(max((profile.child_peak_rss for profile in self.stages if profile.child_peak_rss), default=None)),
+            str(sum(profile.triples or 0 for profile in self.stages)),
+        ))
+
+        widths = [max(len(row[i]) for row in rows) for i in range(len(rows[0]))]
+
+        return "\n".join(
+            "  ".join(cell.ljust(width) if i == 0 else cell.rjust(width) for i, (cell, width) in enumerate(zip(row, widths)))
+            for row in rows
+        )
+
+    def write_json(self, path: str | Path) -> None:
+        Path(path).write_text(json.dumps([asdict(profile) for profile in self.stages], indent=2))
@@ -1,203 +1,1096 @@
+from dataclasses import dataclass, replace
 from pathlib import Path
+from typing import Callable
+import hashlib
+import os
+import select
 import subprocess
 import tempfile
-from rdflib import Graph, URIRef
+import threading
+from urllib.parse import urlparse
+from urllib.request import Request, url2pathname, urlopen
+from rdflib import BNode, Graph, URIRef
+from rdflib.graph import ReadOnlyGraphAggregate
+from rdflib.namespace import OWL, RDF
+from rdflib.util import guess_format
+#
+from utils.cache_utils import ReasonerCache, apply_delta, graph_digest, result_delta
+from utils.consistency_utils import ClashDetector, ConsistencyReport
+from utils.daemon_utils import ReasonerDaemon
+from utils.metrics_utils import MetricsHook, ReasoningMetrics, count_inferred, run_measured
+from utils.module_utils import ModuleExtractor, graph_signature
+from utils.rule_utils import Rule, abox_individuals, compile_rules, materialize
+from utils.shard_utils import joining_predicates, reason_in_shards
+
+# Parsed ontologies, keyed by URL, along with the fingerprint they were parsed at.
+#
+_ontology_cache: dict[str, tuple[str, Graph]] = {}
+_ontology_cache_lock = threading.Lock()
+
+# Rules and module extractors built from the cached ontologies, keyed by URL
+# along with the graph they came from.
+#
+_rules_cache: dict[str, tuple[Graph, list[Rule]]] = {}
+_extractor_cache: dict[str, tuple[Graph, ModuleExtractor]] = {}
+_detector_cache: dict[str, tuple[Graph, ClashDetector]] = {}
+
+# Formats of the remote ontologies by content type, when their URL does not tell.
+#
+CONTENT_FORMATS = {
+    "text/turtle": "turtle",
+    "application/rdf+xml": "xml",
+    "application/n-triples": "nt",
+    "application/ld+json": "json-ld",
+}
+
+
+def _local_path(ontology_url: str) -> Path:
+    parsed = urlparse(ontology_url)
+
+    return Path(url2pathname(parsed.path)) if parsed.scheme == "file" else Path(ontology_url)
+
+
+def _ontology_fingerprint(ontology_url: str) -> tuple[str, bytes | None, str | None]:
+    # Return the fingerprint, and the document with its format when it had to be downloaded for it.
+    parsed = urlparse(ontology_url)
+
+    if parsed.scheme in ("http", "https"):
+        with urlopen(Request(ontology_url, method="HEAD")) as response:
+            validator = response.headers.get("ETag") or response.headers.get("Last-Modified")
+
+        if validator:
+            return validator, None, None
+
+        # No validator from the server, fall back to hashing the content.
+        with urlopen(ontology_url) as response:
+            body = response.read()
+            content_type = response.headers.get_content_type()
+
+        rdf_format = guess_format(parsed.path) or CONTENT_FORMATS.get(content_type, "xml")
+
+        return hashlib.sha256(body).hexdigest(), body, rdf_format
+
+    stat = _local_path(ontology_url).stat()
+
+    return f"{stat.st_mtime_ns}:{stat.st_size}", None, None
+
+
+def load_ontology(ontology_url: str) -> Graph:
+    """
+    Return the parsed ontology at ontology_url, parsing it only when needed.
+
+    Local files are revalidated with their mtime and size, remote ones with
+    their ETag or Last-Modified header, or a hash of their content when the
+    server sends neither. The content downloaded for the hash is the one
+    parsed, when it changed. The returned graph is shared between callers
+    and must not be modified.
+    """
+    fingerprint, body, rdf_format = _ontology_fingerprint(ontology_url)
+
+    with _ontology_cache_lock:
+        cached = _ontology_cache.get(ontology_url)
+
+        if cached is not None and cached[0] == fingerprint:
+            return cached[1]
+
+        ontology = Graph()
+
+        if body is not None:
+            ontology.parse(data=body, format=rdf_format, publicID=ontology_url)
+        else:
+            ontology.parse(source=ontology_url)
+
+        _ontology_cache[ontology_url] = (fingerprint, ontology)
+
+    return ontology
+
+
+def clear_ontology_cache(ontology_url: str | None = None) -> None:
+    """
+    Drop one cached ontology, or all of them when no URL is given.
+    """
+    with _ontology_cache_lock:
+        if ontology_url is None:
+            _ontology_cache.clear()
+            _rules_cache.clear()
+            _extractor_cache.clear()
+            _detector_cache.clear()
+        else:
+            _ontology_cache.pop(ontology_url, None)
+            _rules_cache.pop(ontology_url, None)
+            _extractor_cache.pop(ontology_url, None)
+            _detector_cache.pop(ontology_url, None)
+
+
+def _from_ontology(ontology_url: str, store: dict, compute):
+    ontology = load_ontology(ontology_url)
+
+    with _ontology_cache_lock:
+        cached = store.get(ontology_url)
+
+        if cached is None or cached[0] is not ontology:
+            cached = (ontology, compute(ontology))
+            store[ontology_url] = cached
+
+    return cached[1]
+
+
+def load_rules(ontology_url: str) -> list[Rule]:
+    """
+    Return the rules compiled from the ontology at ontology_url.
+
+    Rules are recompiled only when load_ontology hands back a new graph.
+    """
+    return _from_ontology(ontology_url, _rules_cache, compile_rules)
+
+
+def load_module_extractor(ontology_url: str) -> ModuleExtractor:
+    """
+    Return the module extractor of the ontology at ontology_url, see utils/module_utils.py.
+
+    The ontology is split into axioms again only when load_ontology hands back a new graph.
+    """
+    return _from_ontology(ontology_url, _extractor_cache, ModuleExtractor)
+
+
+def load_clash_detector(ontology_url: str) -> ClashDetector:
+    """
+    Return the clash detector of the ontology at ontology_url, see utils/consistency_utils.py.
+    """
+    return _from_ontology(ontology_url, _detector_cache, ClashDetector)
+
+
+def ontology_digest(ontology_url: str) -> str:
+    """
+    Identify the version of the ontology at ontology_url.
+
+    Local files are hashed, which is much cheaper than canonicalizing the
+    parsed graph. Remote ones are identified like in load_ontology.
+    """
+    if urlparse(ontology_url).scheme in ("http", "https"):
+        return _ontology_fingerprint(ontology_url)[0]
+
+    return hashlib.sha256(_local_path(ontology_url).read_bytes()).hexdigest()
+
+
+def _reason_through_pipes(
+    graph: Graph,
+    daemon: ReasonerDaemon,
+    tmpdir: Path,
+    reasoner: str,
+    axiom_generators: list[str],
+    include_subclasses: bool,
+) -> Graph:
+
+    # The daemon reads the input while it is being serialized, and the output
+    # is parsed while the daemon writes it, so neither ever lands on disk.
+    pipe_pre = tmpdir / "input.nt"
+    pipe_post = tmpdir / "output.nt"
+    os.mkfifo(pipe_pre)
+    os.mkfifo(pipe_post)
+
+    g_post = Graph()
+    errors = []
+
+    # Open the read end of the output right away, without waiting for a writer,
+    # so the daemon never blocks on it and a failed request can be released.
+    fd_post = os.open(pipe_post, os.O_RDONLY | os.O_NONBLOCK)
+
+    def write() -> None:
+        try:
+            graph.serialize(destination=pipe_pre, format="nt", encoding="utf-8")
+        except Exception as e:
+            errors.append(e)
+
+    def read() -> None:
+        try:
+            select.select([fd_post], [], [])
+            os.set_blocking(fd_post, True)
+
+            with os.fdopen(fd_post, "rb") as stream:
+                g_post.parse(source=stream, format="nt")
+        except Exception as e:
+            errors.append(e)
+
+    writer = threading.Thread(target=write)
+    reader = threading.Thread(target=read)
+    writer.start()
+    reader.start()
+
+    try:
+        daemon.reason(
+            pipe_pre,
+            pipe_post,
+            reasoner=reasoner,
+            axiom_generators=axiom_generators,
+            include_subclasses=include_subclasses,
+        )
+    except Exception:
+        # Connect and hang up as the writer of the output, which ends the reader.
+        os.close(os.open(pipe_post, os.O_WRONLY | os.O_NONBLOCK))
+
+        # Drain the input until the writer is done with it.
+        fd_pre = os.open(pipe_pre, os.O_RDONLY | os.O_NONBLOCK)
+
+        try:
+            while writer.is_alive():
+                try:
+                    os.read(fd_pre, 1 << 16)
+                except BlockingIOError:
+                    writer.join(0.01)
+        finally:
+            os.close(fd_pre)
+
+        raise
+    finally:
+        writer.join()
+        reader.join()
+
+    if errors:
+        raise errors[0]
+
+    return g_post
+
+
+def reason_with_rules(graph: Graph, rules: list[Rule] | None = None) -> Graph:
+    """
+    Materialize what the rules entail from a graph, those compiled from the graph itself by default.
+
+    Like the ROBOT output, the individuals are typed as owl:NamedIndividual,
+    but not the classes and properties of the ontology the graph may hold.
+    """
+    out = materialize(graph, compile_rules(graph) if rules is None else rules, declare_individuals=False)
+    out.addN((individual, RDF["type"], OWL["NamedIndividual"], out) for individual in abox_individuals(graph))
+
+    return out
+
+
+def robot_command(
+    reasoner: str,
+    axiom_generators: list[str],
+    include_subclasses: bool,
+    input_path: Path,
+    output_path: Path,
+) -> list:
+    """
+    Return the ROBOT command line reasoning over input_path into output_path.
+    """
+    return [
+        "java",
+        "-jar",
+        "jarfiles/robot.jar",
+        "reason",
+        "--reasoner",
+        reasoner,
+        "include-indirect",
+        "true" if include_subclasses else "false",
+        "--axiom-generators",
+        " ".join(ax for ax in axiom_generators),
+        "--input",
+        input_path,
+        "--output",
+        output_path,
+    ]
+
+
+TRANSPORTS = ("turtle", "ntriples", "pipe")
+
+
+def transport_files(transport: str, tmpdir: Path, daemon: bool = False) -> tuple[Path, str, Path, str]:
+    """
+    Return the input and output files of a reasoner run for a transport, with their rdflib formats.
+
+    The ROBOT command line cannot write N-Triples, only a daemon can.
+    """
+    if transport not in TRANSPORTS:
+        raise ValueError(f"Unknown transport: {transport}")
+
+    if transport == "turtle":
+        return tmpdir / "input.ttl", "turtle", tmpdir / "output.ttl", "turtle"
+
+    if daemon:
+        return tmpdir / "input.nt", "nt", tmpdir / "output.nt", "nt"
+
+    return tmpdir / "input.nt", "nt", tmpdir / "output.ttl", "turtle"
+
+
+def materialize_with_ontology(graph: Graph, ontology_url: str) -> Graph:
+    """
+    Return the ontology and an instance graph, along with what the rules of the ontology entail from the graph.
+
+    The rules are compiled once per version of the ontology, see load_rules.
+    """
+    return ReadOnlyGraphAggregate([load_ontology(ontology_url), reason_with_rules(graph, load_rules(ontology_url))])
+
+
+def _run_reasoner(
+    graph: Graph,
+    reasoner: str,
+    axiom_generators: list[str],
+    include_subclasses: bool,
+    daemon: ReasonerDaemon | None,
+    transport: str,
+    tmp_dir: str | None,
+    metrics: ReasoningMetrics,
+) -> Graph:
+    if reasoner == "rules":
+        with metrics.phase("reason"):
+            return reason_with_rules(graph)
+
+    if transport not in TRANSPORTS:
+        raise ValueError(f"Unknown transport: {transport}")
+
+    with tempfile.TemporaryDirectory(dir=tmp_dir) as tmpdir:
+        tmpdir = Path(tmpdir)
+
+        if transport == "pipe":
+            if daemon is None:
+                raise ValueError("The pipe transport needs a reasoner daemon")
+
+            # Serializing and parsing overlap with the reasoning, all of it counts as reasoning.
+            try:
+                with metrics.phase("reason"):
+                    return _reason_through_pipes(graph, daemon, tmpdir, reasoner, axiom_generators, include_subclasses)
+            finally:
+                metrics.child_peak_rss = daemon.peak_rss()
+
+        tmp_path_pre, format_pre, tmp_path_post, format_post = transport_files(transport, tmpdir, daemon is not None)
+
+        with metrics.phase("serialize"):
+            graph.serialize(destination=tmp_path_pre, format=format_pre, encoding="utf-8")
+
+        with metrics.phase("reason"):
+            if daemon is not None:
+                try:
+                    daemon.reason(
+                        tmp_path_pre,
+                        tmp_path_post,
+                        reasoner=reasoner,
+                        axiom_generators=axiom_generators,
+                        include_subclasses=include_subclasses,
+                    )
+                finally:
+                    metrics.child_peak_rss = daemon.peak_rss()
+            else:
+                run_measured(
+                    robot_command(reasoner, axiom_generators, include_subclasses, tmp_path_pre, tmp_path_post),
+                    metrics,
+                    stderr=subprocess.DEVNULL,
+                )
+
+        with metrics.phase("parse"):
+            g_post = Graph()
+            g_post.parse(source=tmp_path_post, format=format_post)
+
+    return g_post
+
+
+def reasoner_options(
+    reasoner: str,
+    axiom_generators: list[str],
+    include_subclasses: bool,
+) -> list[str]:
+    """
+    Return the reasoner options as strings, to make cache keys of.
+    """
+    return [reasoner, " ".join(axiom_generators), str(include_subclasses)]
+
 
 def call_reasoner(
     graph: Graph,
     reasoner: str = "hermit",
     axiom_generators: list[str] = ["ClassAssertion", "PropertyAssertion"],
     include_subclasses: bool = True,
+    daemon: ReasonerDaemon | None = None,
+    transport: str = "turtle",
+    tmp_dir: str | None = None,
+    cache: ReasonerCache | None = None,
+    cache_key: str | None = None,
+    metrics_hook: MetricsHook | None = None,
+    delta: bool = False,
 ) -> Graph:
-    with tempfile.TemporaryDirectory() as tmpdir:
-        tmpdir = Path(tmpdir)
+    """
+    Reason over a graph with ROBOT and return the post-reasoning graph.
 
-        tmp_path_pre = tmpdir / "input.ttl"
-        tmp_path_post = tmpdir / "output.ttl"
-
-        graph.serialize(destination=tmp_path_pre, format="turtle")
-
-        subprocess.run(
-            [
-                "java",
-                "-jar",
-                "jarfiles/robot.jar",
-                "reason",
-                "--reasoner",
-                reasoner,
-                "include-indirect",
-                "true" if include_subclasses else "false",
-                "--axiom-generators",
-                " ".join(ax for ax in axiom_generators),
-                "--input",
-                tmp_path_pre,
-                "--output",
-                tmp_path_post,
-            ],
-            stderr=subprocess.DEVNULL,
-        )
+    When a daemon is given, the request goes to its already running JVM
+    instead of starting a new one. The daemon has its own TBox preloaded,
+    so the graph only needs to hold the instance data in that case.
+
+    With reasoner="rules", the rule-expressible axioms of the graph are
+    materialized in-process by utils/rule_utils.py instead, without Java.
+    That always yields indirect class and property assertions, whatever
+    the axiom generators, and does not check consistency.
+
+    The transport decides how the graph travels to the reasoner:
+
+    - "turtle" writes and reads back Turtle files.
+    - "ntriples" writes N-Triples, which is much cheaper to emit and parse.
+      The output is N-Triples too with a daemon, but stays Turtle with the
+      ROBOT command line, which cannot write N-Triples.
+    - "pipe" streams N-Triples both ways through named pipes, parsing the
+      output as it is produced. It needs a daemon.
+
+    Temporary files go in tmp_dir when given, e.g. "/dev/shm" to keep them
+    in memory.
+
+    With a cache, the result is looked up under cache_key, or else under a
+    key made of the graph digest and the reasoner options, before any
+    reasoner runs, and stored there afterwards.
+
+    A metrics_hook is called with the ReasoningMetrics of the call once it
+    is done, see utils/metrics_utils.py.
+
+    With delta, only the triples inferred about the resources of the graph
+    are returned, see inferred_triples.
+    """
+    metrics = ReasoningMetrics()
+    g_post = _call_reasoner(graph, reasoner, axiom_generators, include_subclasses, daemon, transport, tmp_dir, cache, cache_key, metrics)
 
-        g_post = Graph()
-        g_post.parse(source=tmp_path_post)
+    if delta:
+        with metrics.phase("describe"):
+            g_post = inferred_triples(g_post, graph)
+
+    if metrics_hook is not None:
+        metrics.triples_in = len(graph)
+        metrics.triples_out = len(g_post)
+        metrics.inferred = count_inferred(graph, g_post)
+        metrics_hook(metrics)
 
     return g_post
 
 
-def reason_with_ontology(
+def _call_reasoner(
     graph: Graph,
-    ontology_url: str,
+    reasoner: str,
+    axiom_generators: list[str],
+    include_subclasses: bool,
+    daemon: ReasonerDaemon | None,
+    transport: str,
+    tmp_dir: str | None,
+    cache: ReasonerCache | None,
+    cache_key: str | None,
+    metrics: ReasoningMetrics,
 ) -> Graph:
+    if cache is None:
+        return _run_reasoner(graph, reasoner, axiom_generators, include_subclasses, daemon, transport, tmp_dir, metrics)
 
-    # res_set = {x for s, _, o in graph for x in (s, o) if isinstance(x, URIRef)}
+    with metrics.phase("cache"):
+        if cache_key is None:
+            # A daemon reasons with its own TBox, which the graph does not hold.
+            tbox = ontology_digest(daemon.ontology_url) if daemon is not None else ""
+            cache_key = cache.key(graph_digest(graph), tbox, *reasoner_options(reasoner, axiom_generators, include_subclasses))
 
-    res_set = {
-        x
-        for subj, _, obj in graph
-        for x in (subj, obj)
-        if isinstance(x, URIRef)
-    }
+        delta = cache.get(cache_key)
+
+        if delta is not None:
+            metrics.cache_hit = True
+            return apply_delta(delta, graph)
 
-    uri_block = " ".join(f"<{subj}>" for subj in res_set)
+    metrics.cache_hit = False
+    g_post = _run_reasoner(graph, reasoner, axiom_generators, include_subclasses, daemon, transport, tmp_dir, metrics)
 
-    graph_pre = Graph()
+    with metrics.phase("cache"):
+        cache.put(cache_key, result_delta(g_post, graph))
 
-    for triple in graph:
-        graph_pre.add(triple)
+    return g_post
+
+
+def reasoner_input(
+    graph: Graph,
+    ontology_url: str,
+    daemon: ReasonerDaemon | None,
+    reasoner: str,
+    cache: ReasonerCache | None,
+    module: bool,
+) -> tuple[Graph, str | None]:
+    """
+    Return what to hand the reasoner for an instance graph, and its cache key when there is a cache.
+    """
+    # Key the cache on the data and the ontology digest, so the TBox is never rehashed.
+    # Daemon results are cached without the TBox, so they are kept apart from ROBOT ones.
+    cache_key = None
+
+    if cache is not None:
+        cache_key = cache.key(
+            graph_digest(graph),
+            ontology_digest(ontology_url),
+            "daemon" if daemon is not None else "module" if module else "robot",
+            *reasoner_options(reasoner, ["ClassAssertion", "PropertyAssertion"], True),
+        )
 
-    # for prefix, namespace in graph.namespaces():
-        # graph_pre.bind(prefix, namespace)
+    # The daemon already holds the TBox, so only the instance data is sent to it.
+    if daemon is not None:
+        return graph, cache_key
 
-    graph_pre.parse(source=ontology_url)
+    # Only the part of the ontology relevant to the terms of the data is needed.
+    if module:
+        tbox = load_module_extractor(ontology_url).extract(graph_signature(graph))
+    else:
+        tbox = load_ontology(ontology_url)
 
-    graph_post = call_reasoner(graph_pre)
+    # Read-only union of the ontology and the data, nothing is copied.
+    # The reasoner input is serialized straight from this view.
+    return ReadOnlyGraphAggregate([tbox, graph]), cache_key
 
-    sparql_result = graph_post.query(
-        f"""
-        DESCRIBE {uri_block}
-        """
+
+def _reason_over(
+    graph: Graph,
+    ontology_url: str,
+    daemon: ReasonerDaemon | None = None,
+    reasoner: str = "hermit",
+    transport: str = "turtle",
+    cache: ReasonerCache | None = None,
+    module: bool = False,
+    metrics: ReasoningMetrics | None = None,
+) -> Graph:
+    metrics = ReasoningMetrics() if metrics is None else metrics
+
+    # The rule engine only needs the data, the ontology is reused as compiled rules.
+    if reasoner == "rules":
+        with metrics.phase("reason"):
+            return materialize_with_ontology(graph, ontology_url)
+
+    if daemon is not None and daemon.ontology_url != ontology_url:
+        raise ValueError(f"Daemon was started for {daemon.ontology_url}, not {ontology_url}")
+
+    with metrics.phase("prepare"):
+        graph_pre, cache_key = reasoner_input(graph, ontology_url, daemon, reasoner, cache, module)
+
+    graph_post = _call_reasoner(
+        graph_pre,
+        reasoner,
+        ["ClassAssertion", "PropertyAssertion"],
+        True,
+        daemon,
+        transport,
+        None,
+        cache,
+        cache_key,
+        metrics,
     )
 
-    out = sparql_result.graph
+    # ROBOT returns the TBox it was given along with the data, the daemon leaves
+    # its preloaded one out. It is put back so both give the same graph.
+    if daemon is not None:
+        return ReadOnlyGraphAggregate([load_ontology(ontology_url), graph_post])
+
+    return graph_post
+
+
+def _emit_metrics(
+    metrics_hook: MetricsHook | None,
+    metrics: ReasoningMetrics,
+    graph: Graph,
+    ontology_url: str,
+    graph_post: Graph,
+    out: Graph,
+) -> None:
+    if metrics_hook is None:
+        return
+
+    metrics.triples_in = len(graph)
+    metrics.triples_out = len(out)
+    # Whichever way the reasoner got the TBox, none of it counts as inferred.
+    metrics.inferred = count_inferred(ReadOnlyGraphAggregate([load_ontology(ontology_url), graph]), graph_post)
+    metrics_hook(metrics)
+
+
+def describe_resources(
+    graph: Graph,
+    resources: set[URIRef],
+    target_graph: Graph | None = None,
+) -> Graph:
+    """
+    Same result as DESCRIBE over the resources, without going through SPARQL.
+
+    Each resource contributes its Concise Bounded Description, found with
+    index lookups on the graph, so the cost follows the size of the output
+    rather than the length of a query listing every IRI.
+    """
+    out = Graph() if target_graph is None else target_graph
 
     for prefix, namespace in graph.namespaces():
         out.bind(prefix, namespace)
 
+    for resource in resources:
+        graph.cbd(resource, target_graph=out)
+
     return out
 
 
-from rdflib.namespace import RDF
+def incoming_triples(
+    graph: Graph,
+    resources: set[URIRef],
+    target_graph: Graph | None = None,
+) -> Graph:
+    """
+    Collect every triple of the graph whose object is one of the resources.
+    """
+    out = Graph() if target_graph is None else target_graph
 
-def reason_with_ontology2(
+    for prefix, namespace in graph.namespaces():
+        out.bind(prefix, namespace)
+
+    for resource in resources:
+        for triple in graph.triples((None, None, resource)):
+            out.add(triple)
+
+    return out
+
+
+def inferred_triples(
+    graph_post: Graph,
     graph: Graph,
-    ontology_url: str,
+    target_graph: Graph | None = None,
 ) -> Graph:
+    """
+    Collect the triples of graph_post about the resources of graph that graph does not hold.
+
+    Only the triples of the resources are visited, each one checked against
+    the index of graph. Blank node triples, which the reasoner relabels, and
+    owl:NamedIndividual declarations are left out, so the result can be
+    appended as it is to a store already holding graph.
+    """
+    out = Graph() if target_graph is None else target_graph
+
+    for prefix, namespace in graph.namespaces():
+        out.bind(prefix, namespace)
+
+    for resource in _resources(graph, with_types=False):
+        for triple in graph_post.triples((resource, None, None)):
+            _, pred, obj = triple
+
+            if isinstance(obj, BNode) or (pred == RDF["type"] and obj == OWL["NamedIndividual"]):
+                continue
+
+            if triple not in graph:
+                out.add(triple)
+
+    return out
 
+
+def _resources(graph: Graph, with_types: bool = True) -> set[URIRef]:
     # res_set = {x for s, _, o in graph for x in (s, o) if isinstance(x, URIRef)}
 
-    resource_set = {
+    return {
         x
-        for subj, _, obj in graph
+        for subj, pred, obj in graph
         for x in (subj, obj)
-        if isinstance(x, URIRef)
+        if isinstance(x, URIRef) and (with_types or x is subj or pred != RDF["type"])
     }
 
-    type_set = {
-        obj
-        for _, _, obj
-        in graph.triples((None, RDF["type"], None))
-    }
 
-    print(resource_set)
-    print(type_set)
+# Extraction strategies select what to return of the post-reasoning graph,
+# given the graph that was reasoned over.
+#
+ExtractionStrategy = Callable[[Graph, Graph, Graph | None], Graph]
+
 
-    resource_set = resource_set - type_set
+def extract_describe(
+    graph_post: Graph,
+    graph: Graph,
+    target_graph: Graph | None = None,
+) -> Graph:
+    """
+    Describe every IRI used in the input graph.
+    """
+    return describe_resources(graph_post, _resources(graph), target_graph)
+
+
+def extract_describe_individuals(
+    graph_post: Graph,
+    graph: Graph,
+    target_graph: Graph | None = None,
+) -> Graph:
+    """
+    Describe the IRIs used in the input graph, except the classes it types things with.
+    """
+    type_set = set(graph.objects(None, RDF["type"]))
 
-    uri_block = " ".join(f"<{subj}>" for subj in resource_set)
+    return describe_resources(graph_post, _resources(graph) - type_set, target_graph)
+
+
+def extract_incoming(
+    graph_post: Graph,
+    graph: Graph,
+    target_graph: Graph | None = None,
+) -> Graph:
+    """
+    Collect the triples pointing at an IRI used in the input graph.
+    """
+    return incoming_triples(graph_post, _resources(graph), target_graph)
+
+
+def extract_inferred(
+    graph_post: Graph,
+    graph: Graph,
+    target_graph: Graph | None = None,
+) -> Graph:
+    """
+    Collect what was inferred about the IRIs used in the input graph, see inferred_triples.
+    """
+    return inferred_triples(graph_post, graph, target_graph)
 
-    graph_pre = Graph()
 
-    for triple in graph:
-        graph_pre.add(triple)
+EXTRACTION_STRATEGIES: dict[str, ExtractionStrategy] = {
+    "describe": extract_describe,
+    "describe-individuals": extract_describe_individuals,
+    "incoming": extract_incoming,
+    "inferred": extract_inferred,
+}
 
-    # for prefix, namespace in graph.namespaces():
-        # graph_pre.bind(prefix, namespace)
 
-    graph_pre.parse(source=ontology_url)
+def extraction_strategy(extract: str | ExtractionStrategy) -> ExtractionStrategy:
+    """
+    Return the extraction strategy of EXTRACTION_STRATEGIES with the given name, or the callable given.
+    """
+    if not isinstance(extract, str):
+        return extract
 
-    graph_post = call_reasoner(graph_pre)
+    if extract not in EXTRACTION_STRATEGIES:
+        raise ValueError(f"Unknown extraction strategy: {extract}")
 
-    sparql_result = graph_post.query(
-        f"""
-        DESCRIBE {uri_block}
+    return EXTRACTION_STRATEGIES[extract]
+
+
+@dataclass
+class ReasoningEngine:
+    """
+    Reason over instance graphs with an ontology and extract part of the result.
+
+    The extraction strategy is one of EXTRACTION_STRATEGIES by name, or any
+    callable with the same signature. It is run on the post-reasoning graph
+    and the graph that was reasoned over. The post-reasoning graph holds
+    the whole ontology whichever way it was reasoned over, by ROBOT, the
+    daemon or the rule engine.
+
+    With shards, the graph is split into connected components that are
+    packed into that many shards and reasoned over in a process pool, see
+    utils/shard_utils.py. Resources used in more than hub_degree triples
+    do not join components together, unless they are linked with a
+    transitive or property chain property. The engine is sent to the pool
+    without its metrics hook, and a callable strategy must be picklable.
+
+    With module, ROBOT reasons over the module of the ontology for the
+    terms used in the graph instead of the whole ontology, see
+    utils/module_utils.py. The daemon and the rule engine keep the whole
+    ontology loaded already and ignore it.
+
+    The metrics hook is called with the ReasoningMetrics of each call, see
+    call_reasoner. Sharded calls time all the shards as a single phase.
+    """
+
+    ontology_url: str
+    reasoner: str = "hermit"
+    transport: str = "turtle"
+    extract: str | ExtractionStrategy = "describe"
+    daemon: ReasonerDaemon | None = None
+    cache: ReasonerCache | None = None
+    module: bool = False
+    shards: int | None = None
+    hub_degree: int | None = 1000
+    metrics_hook: MetricsHook | None = None
+
+    def _reason_in_shards(self, graph: Graph) -> Graph:
+        if self.daemon is not None:
+            raise ValueError("A daemon cannot be shared between shard processes")
+
+        ontology = load_ontology(self.ontology_url)
+        tbox_terms = {
+            node
+            for triple in ontology
+            for node in triple
+            if isinstance(node, URIRef)
+        }
+
+        metrics = ReasoningMetrics()
+
+        with metrics.phase("shards"):
+            out = reason_in_shards(
+                graph,
+                replace(self, shards=None, metrics_hook=None).reason,
+                self.shards,
+                tbox_terms=tbox_terms,
+                hub_degree=self.hub_degree,
+                joining=joining_predicates(ontology),
+            )
+
+        if self.metrics_hook is not None:
+            metrics.triples_in = len(graph)
+            metrics.triples_out = len(out)
+            metrics.inferred = count_inferred(graph, out)
+            self.metrics_hook(metrics)
+
+        return out
+
+    def reason(self, graph: Graph) -> Graph:
+        """
+        Reason over an instance graph and extract from the result.
         """
+        extract = extraction_strategy(self.extract)
+
+        if self.shards is not None and self.shards > 1:
+            return self._reason_in_shards(graph)
+
+        metrics = ReasoningMetrics()
+
+        graph_post = _reason_over(
+            graph,
+            self.ontology_url,
+            self.daemon,
+            self.reasoner,
+            self.transport,
+            self.cache,
+            self.module,
+            metrics,
+        )
+
+        with metrics.phase("describe"):
+            out = extract(graph_post, graph)
+
+        for prefix, namespace in graph.namespaces():
+            out.bind(prefix, namespace)
+
+        _emit_metrics(self.metrics_hook, metrics, graph, self.ontology_url, graph_post, out)
+
+        return out
+
+    def reason_many(self, graphs: list[Graph]) -> list[Graph]:
+        """
+        Reason over many instance graphs with a single reasoner run.
+
+        The inputs are merged, reasoned over once, and the extraction runs
+        per input. The returned graphs keep the order and the identifiers of
+        the inputs, so each one can be stored back as the named graph it
+        came from. The merged graph is never sharded.
+
+        Resources shared between inputs are the same individuals to the
+        reasoner, so inferences about them show up in every graph using them.
+        """
+        extract = extraction_strategy(self.extract)
+
+        merged = ReadOnlyGraphAggregate(graphs)
+
+        metrics = ReasoningMetrics()
+
+        graph_post = _reason_over(
+            merged,
+            self.ontology_url,
+            self.daemon,
+            self.reasoner,
+            self.transport,
+            self.cache,
+            self.module,
+            metrics,
+        )
+
+        outs = []
+
+        for graph in graphs:
+            out = Graph(identifier=graph.identifier)
+
+            with metrics.phase("describe"):
+                extract(graph_post, graph, out)
+
+            for prefix, namespace in graph.namespaces():
+                out.bind(prefix, namespace)
+
+            outs.append(out)
+
+        _emit_metrics(self.metrics_hook, metrics, merged, self.ontology_url, graph_post, ReadOnlyGraphAggregate(outs))
+
+        return outs
+
+
+def reason_with_ontology(
+    graph: Graph,
+    ontology_url: str,
+    daemon: ReasonerDaemon | None = None,
+    reasoner: str = "hermit",
+    transport: str = "turtle",
+    cache: ReasonerCache | None = None,
+    module: bool = False,
+    metrics_hook: MetricsHook | None = None,
+    shards: int | None = None,
+    hub_degree: int | None = 1000,
+) -> Graph:
+    """
+    Reason over an instance graph and describe its resources afterwards, see ReasoningEngine.
+    """
+    engine = ReasoningEngine(
+        ontology_url,
+        reasoner=reasoner,
+        transport=transport,
+        extract="describe",
+        daemon=daemon,
+        cache=cache,
+        module=module,
+        shards=shards,
+        hub_degree=hub_degree,
+        metrics_hook=metrics_hook,
     )
 
-    out = sparql_result.graph
+    return engine.reason(graph)
 
-    for prefix, namespace in graph.namespaces():
-        out.bind(prefix, namespace)
 
-    return out
+def reason_with_ontology2(
+    graph: Graph,
+    ontology_url: str,
+    daemon: ReasonerDaemon | None = None,
+    reasoner: str = "hermit",
+    transport: str = "turtle",
+    cache: ReasonerCache | None = None,
+    module: bool = False,
+    metrics_hook: MetricsHook | None = None,
+) -> Graph:
+    """
+    Like reason_with_ontology, leaving out the description of the classes used as types.
+    """
+    engine = ReasoningEngine(
+        ontology_url,
+        reasoner=reasoner,
+        transport=transport,
+        extract="describe-individuals",
+        daemon=daemon,
+        cache=cache,
+        module=module,
+        metrics_hook=metrics_hook,
+    )
+
+    return engine.reason(graph)
 
 
 def reason_with_ontology3(
     graph: Graph,
     ontology_url: str,
+    daemon: ReasonerDaemon | None = None,
+    reasoner: str = "hermit",
+    transport: str = "turtle",
+    cache: ReasonerCache | None = None,
+    module: bool = False,
+    metrics_hook: MetricsHook | None = None,
 ) -> Graph:
+    """
+    Like reason_with_ontology, returning the triples pointing at the resources instead.
+    """
+    engine = ReasoningEngine(
+        ontology_url,
+        reasoner=reasoner,
+        transport=transport,
+        extract="incoming",
+        daemon=daemon,
+        cache=cache,
+        module=module,
+        metrics_hook=metrics_hook,
+    )
 
-    # res_set = {x for s, _, o in graph for x in (s, o) if isinstance(x, URIRef)}
+    return engine.reason(graph)
 
-    resource_set = {
-        x
-        for subj, _, obj in graph
-        for x in (subj, obj)
-        if isinstance(x, URIRef)
-    }
 
-    type_set = {
-        obj
-        for _, _, obj
-        in graph.triples((None, RDF["type"], None))
-    }
+def reason_many(
+    graphs: list[Graph],
+    ontology_url: str,
+    daemon: ReasonerDaemon | None = None,
+    reasoner: str = "hermit",
+    transport: str = "turtle",
+    cache: ReasonerCache | None = None,
+    module: bool = False,
+    metrics_hook: MetricsHook | None = None,
+) -> list[Graph]:
+    """
+    Reason over many instance graphs with a single reasoner run, see ReasoningEngine.reason_many.
+    """
+    engine = ReasoningEngine(
+        ontology_url,
+        reasoner=reasoner,
+        transport=transport,
+        extract="describe",
+        daemon=daemon,
+        cache=cache,
+        module=module,
+        metrics_hook=metrics_hook,
+    )
 
-    print(resource_set)
-    print(type_set)
+    return engine.reason_many(graphs)
 
-    # resource_set = resource_set - type_set
 
-    uri_block = " ".join(f"<{subj}>" for subj in resource_set)
+def _check_with_reasoner(
+    graph: Graph,
+    ontology_url: str,
+    daemon: ReasonerDaemon | None,
+    reasoner: str,
+    module: bool,
+    tmp_dir: str | None,
+) -> bool:
+    with tempfile.TemporaryDirectory(dir=tmp_dir) as tmpdir:
+        if daemon is not None:
+            tmp_path_pre = Path(tmpdir) / "input.nt"
+            graph.serialize(destination=tmp_path_pre, format="nt", encoding="utf-8")
+
+            return daemon.check(tmp_path_pre, reasoner=reasoner)
 
-    graph_pre = Graph()
+        # Consistency with a module for the terms of the data is consistency with the ontology.
+        if module:
+            tbox = load_module_extractor(ontology_url).extract(graph_signature(graph))
+        else:
+            tbox = load_ontology(ontology_url)
 
-    for triple in graph:
-        graph_pre.add(triple)
+        tmp_path_pre = Path(tmpdir) / "input.ttl"
+        ReadOnlyGraphAggregate([tbox, graph]).serialize(destination=tmp_path_pre, format="turtle")
 
-    # for prefix, namespace in graph.namespaces():
-        # graph_pre.bind(prefix, namespace)
+        # Same HermiT jar as tests/hermit_tests.py, but -k only checks whether
+        # owl:Thing is satisfiable, which it is exactly when the input is consistent.
+        command = ["java", "-jar", "jarfiles/HermiT.jar", "-k", tmp_path_pre.resolve().as_uri()]
+        result = subprocess.run(command, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True)
 
-    graph_pre.parse(source=ontology_url)
+    # HermiT either answers that owl:Thing is not satisfiable, or fails on the
+    # inconsistency. Anything else it fails on, like a missing jar, a crash
+    # or a parse error, says nothing about the input.
+    if "not satisfiable" in result.stdout or "InconsistentOntologyException" in result.stdout:
+        return False
 
-    graph_post = call_reasoner(graph_pre)
+    if result.returncode != 0:
+        raise subprocess.CalledProcessError(result.returncode, command, output=result.stdout)
 
-    sparql_query = f"""
-        SELECT ?subj ?pred ?obj
-        WHERE {{
-        VALUES ?obj {{ {uri_block} }}
-        ?subj ?pred ?obj .
-        }}
-        """
+    return True
 
-    print(sparql_query)
 
-    sparql_result = graph_post.query(
-        sparql_query
-            )
+def check_consistency(
+    graph: Graph,
+    ontology_url: str,
+    fallback: bool | str = "auto",
+    daemon: ReasonerDaemon | None = None,
+    reasoner: str = "hermit",
+    module: bool = True,
+    tmp_dir: str | None = None,
+) -> ConsistencyReport:
+    """
+    Check an instance graph for consistency with the ontology, without materializing anything.
 
-    out = sparql_result.graph
+    The clash detector of utils/consistency_utils.py runs first. Any clash
+    it finds is final, and comes with the offending individuals. When it
+    finds none, the graph is handed to a DL reasoner depending on fallback:
 
-    for prefix, namespace in graph.namespaces():
-        out.bind(prefix, namespace)
+    - "auto" only when the detector cannot settle it for this graph,
+    - True always,
+    - False never, trusting the detector.
 
-    return out
+    The reasoner is the daemon when one is given, and the HermiT command
+    line otherwise, over the module of the ontology for the terms of the
+    graph unless module is False. The HermiT command line failing for any
+    other reason than an inconsistency raises CalledProcessError.
+    """
+    if daemon is not None and daemon.ontology_url != ontology_url:
+        raise ValueError(f"Daemon was started for {daemon.ontology_url}, not {ontology_url}")
+
+    clashes, conclusive = load_clash_detector(ontology_url).detect(graph)
+
+    if clashes:
+        return ConsistencyReport(False, "rules", clashes)
+
+    if fallback is False or (fallback == "auto" and conclusive):
+        return ConsistencyReport(True, "rules")
 
+    consistent = _check_with_reasoner(graph, ontology_url, daemon, reasoner, module, tmp_dir)
 
+    return ConsistencyReport(consistent, reasoner if daemon is not None else "hermit")
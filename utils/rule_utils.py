@@ -0,0 +1,482 @@
+from rdflib import Graph, Literal, Node, URIRef, Variable
+from rdflib.collection import Collection
+from rdflib.namespace import OWL, RDF, RDFS
+#
+from utils.swrl_utils import SWRL
+
+# An atom is a triple pattern whose predicate is always a constant.
+# Subjects and objects are either constants or rdflib Variables.
+Atom = tuple[Node, URIRef, Node]
+Triple = tuple[Node, URIRef, Node]
+
+X = Variable("x")
+Y = Variable("y")
+Z = Variable("z")
+
+
+class Rule:
+    """
+    A Horn rule over triples: when every body atom matches, the head atoms hold.
+    """
+
+    __slots__ = ("body", "head", "name")
+
+    def __init__(self, body: list[Atom], head: list[Atom], name: str = "") -> None:
+        self.body = tuple(body)
+        self.head = tuple(head)
+        self.name = name
+
+    def __repr__(self) -> str:
+        return f"Rule({self.name or self.body} -> {self.head})"
+
+
+def _members(graph: Graph, list_node: Node) -> list[Node]:
+    return list(Collection(graph, list_node))
+
+
+def _swrl_atoms(graph: Graph, list_node: Node, variables: dict[Node, Variable]) -> list[Atom] | None:
+    def term(node: Node) -> Node:
+        if (node, RDF["type"], SWRL["Variable"]) in graph:
+            return variables.setdefault(node, Variable(f"v{len(variables)}"))
+        return node
+
+    atoms = []
+
+    for atom in _members(graph, list_node):
+        atom_type = graph.value(atom, RDF["type"])
+
+        if atom_type == SWRL["ClassAtom"]:
+            atoms.append((term(graph.value(atom, SWRL["argument1"])), RDF["type"], graph.value(atom, SWRL["classPredicate"])))
+        elif atom_type in (SWRL["IndividualPropertyAtom"], SWRL["DatavaluedPropertyAtom"]):
+            atoms.append((term(graph.value(atom, SWRL["argument1"])), graph.value(atom, SWRL["propertyPredicate"]), term(graph.value(atom, SWRL["argument2"]))))
+        else:
+            # Built-ins and other atom types are outside of what the engine evaluates.
+            return None
+
+    return atoms
+
+
+def compile_rules(ontology: Graph) -> list[Rule]:
+    """
+    Compile the rule-expressible axioms of an ontology into Horn rules.
+
+    Covers the axioms emitted by the utils/base.py and utils/swrl_utils.py
+    builders that have atomic consequences: sub- and equivalent properties,
+    inverses, symmetric and transitive properties, property chains, domains
+    and ranges on named classes, named subclass and equivalent classes,
+    universal restrictions, existential equivalent definitions and SWRL
+    rules. Union domains and ranges, cardinalities and enumerations carry
+    no atomic consequence and are left to a DL reasoner.
+    """
+    rules = []
+
+    for p, q in ontology.subject_objects(RDFS["subPropertyOf"]):
+        if isinstance(p, URIRef) and isinstance(q, URIRef):
+            rules.append(Rule([(X, p, Y)], [(X, q, Y)], "prp-spo1"))
+
+    for p, q in ontology.subject_objects(OWL["equivalentProperty"]):
+        if isinstance(p, URIRef) and isinstance(q, URIRef):
+            rules.append(Rule([(X, p, Y)], [(X, q, Y)], "prp-eqp1"))
+            rules.append(Rule([(X, q, Y)], [(X, p, Y)], "prp-eqp2"))
+
+    for p, q in ontology.subject_objects(OWL["inverseOf"]):
+        if isinstance(p, URIRef) and isinstance(q, URIRef):
+            rules.append(Rule([(X, p, Y)], [(Y, q, X)], "prp-inv1"))
+            rules.append(Rule([(X, q, Y)], [(Y, p, X)], "prp-inv2"))
+
+    for p in ontology.subjects(RDF["type"], OWL["SymmetricProperty"]):
+        if isinstance(p, URIRef):
+            rules.append(Rule([(X, p, Y)], [(Y, p, X)], "prp-symp"))
+
+    for p in ontology.subjects(RDF["type"], OWL["TransitiveProperty"]):
+        if isinstance(p, URIRef):
+            rules.append(Rule([(X, p, Y), (Y, p, Z)], [(X, p, Z)], "prp-trp"))
+
+    for q, chain in ontology.subject_objects(OWL["propertyChainAxiom"]):
+        properties = _members(ontology, chain)
+
+        if isinstance(q, URIRef) and properties and all(isinstance(p, URIRef) for p in properties):
+            links = [Variable(f"x{i}") for i in range(len(properties) + 1)]
+            body = [(links[i], p, links[i + 1]) for i, p in enumerate(properties)]
+            rules.append(Rule(body, [(links[0], q, links[-1])], "prp-spo2"))
+
+    for p, c in ontology.subject_objects(RDFS["domain"]):
+        if isinstance(p, URIRef) and isinstance(c, URIRef):
+            rules.append(Rule([(X, p, Y)], [(X, RDF["type"], c)], "prp-dom"))
+
+    for p, c in ontology.subject_objects(RDFS["range"]):
+        # Datatype ranges type literals, which cannot be subjects.
+        if isinstance(p, URIRef) and isinstance(c, URIRef) and (p, RDF["type"], OWL["DatatypeProperty"]) not in ontology:
+            rules.append(Rule([(X, p, Y)], [(Y, RDF["type"], c)], "prp-rng"))
+
+    for c, d in ontology.subject_objects(RDFS["subClassOf"]):
+        if not isinstance(c, URIRef):
+            continue
+
+        if isinstance(d, URIRef):
+            rules.append(Rule([(X, RDF["type"], c)], [(X, RDF["type"], d)], "cax-sco"))
+
+        elif (d, RDF["type"], OWL["Restriction"]) in ontology:
+            p = ontology.value(d, OWL["onProperty"])
+            filler = ontology.value(d, OWL["allValuesFrom"])
+
+            if isinstance(p, URIRef) and isinstance(filler, URIRef):
+                rules.append(Rule([(X, RDF["type"], c), (X, p, Y)], [(Y, RDF["type"], filler)], "cls-avf"))
+
+    for c, d in ontology.subject_objects(OWL["equivalentClass"]):
+        if not isinstance(c, URIRef):
+            continue
+
+        if isinstance(d, URIRef):
+            rules.append(Rule([(X, RDF["type"], c)], [(X, RDF["type"], d)], "cax-eqc1"))
+            rules.append(Rule([(X, RDF["type"], d)], [(X, RDF["type"], c)], "cax-eqc2"))
+
+        elif (d, RDF["type"], OWL["Restriction"]) in ontology:
+            p = ontology.value(d, OWL["onProperty"])
+            filler = ontology.value(d, OWL["someValuesFrom"])
+
+            if isinstance(p, URIRef) and filler == OWL["Thing"]:
+                rules.append(Rule([(X, p, Y)], [(X, RDF["type"], c)], "cls-svf2"))
+            elif isinstance(p, URIRef) and isinstance(filler, URIRef):
+                rules.append(Rule([(X, p, Y), (Y, RDF["type"], filler)], [(X, RDF["type"], c)], "cls-svf1"))
+
+    for imp in ontology.subjects(RDF["type"], SWRL["Imp"]):
+        variables: dict[Node, Variable] = {}
+        body = _swrl_atoms(ontology, ontology.value(imp, SWRL["body"]), variables)
+        head = _swrl_atoms(ontology, ontology.value(imp, SWRL["head"]), variables)
+
+        if body and head and all(isinstance(atom[1], URIRef) for atom in body + head):
+            rules.append(Rule(body, head, "swrl"))
+
+    return rules
+
+
+class Materializer:
+    """
+    Forward-chaining engine that keeps the closure of a set of triples under rules.
+
+    Triples are indexed by predicate in both directions and rules are
+    dispatched on the predicate (and class, for rdf:type atoms) of each new
+    triple. Evaluation is semi-naive: every round only joins the triples
+    derived in the previous round against the closure.
+
+    The engine is incremental. Explicit triples are kept apart from derived
+    ones, so later calls to add only compute the consequences of the new
+    triples, and remove maintains the closure with Delete/Rederive (DRed)
+    instead of starting over.
+    """
+
+    def __init__(self, rules: list[Rule]) -> None:
+        self.rules = rules
+        self.explicit: set[Triple] = set()
+        self._spo: dict[URIRef, dict[Node, set[Node]]] = {}
+        self._pos: dict[URIRef, dict[Node, set[Node]]] = {}
+        self._dispatch: dict[tuple[URIRef, Node | None], list[tuple[Rule, int]]] = {}
+        self._head_dispatch: dict[tuple[URIRef, Node | None], list[tuple[Rule, int]]] = {}
+
+        for rule in rules:
+            for index, (_, p, o) in enumerate(rule.body):
+                self._dispatch.setdefault(self._key(p, o), []).append((rule, index))
+            for index, (_, p, o) in enumerate(rule.head):
+                self._head_dispatch.setdefault(self._key(p, o), []).append((rule, index))
+
+    @staticmethod
+    def _key(p: URIRef, o: Node) -> tuple[URIRef, Node | None]:
+        return (p, o) if p == RDF["type"] and not isinstance(o, Variable) else (p, None)
+
+    def _candidates(self, dispatch: dict, triple: Triple) -> list[tuple[Rule, int]]:
+        _, p, o = triple
+        candidates = dispatch.get((p, None), [])
+
+        if p == RDF["type"]:
+            candidates = candidates + dispatch.get((p, o), [])
+
+        return candidates
+
+    @staticmethod
+    def _unify(atom: Atom, triple: Triple) -> dict | None:
+        binding = {}
+
+        for term, value in ((atom[0], triple[0]), (atom[2], triple[2])):
+            if isinstance(term, Variable):
+                if binding.get(term, value) != value:
+                    return None
+                binding[term] = value
+            elif term != value:
+                return None
+
+        return binding
+
+    def __contains__(self, triple: Triple) -> bool:
+        s, p, o = triple
+        return o in self._spo.get(p, {}).get(s, ())
+
+    def __len__(self) -> int:
+        return sum(len(objs) for by_subj in self._spo.values() for objs in by_subj.values())
+
+    def __iter__(self):
+        for p, by_subj in self._spo.items():
+            for s, objs in by_subj.items():
+                for o in objs:
+                    yield s, p, o
+
+    def _insert(self, triple: Triple) -> None:
+        s, p, o = triple
+        self._spo.setdefault(p, {}).setdefault(s, set()).add(o)
+        self._pos.setdefault(p, {}).setdefault(o, set()).add(s)
+
+    def _match(self, atom: Atom, binding: dict) -> list[dict]:
+        s, p, o = (binding.get(term, term) if isinstance(term, Variable) else term for term in atom)
+        matches = []
+
+        if not isinstance(s, Variable) and not isinstance(o, Variable):
+            if o in self._spo.get(p, {}).get(s, ()):
+                matches.append(binding)
+        elif not isinstance(s, Variable):
+            for obj in self._spo.get(p, {}).get(s, ()):
+                matches.append({**binding, o: obj})
+        elif not isinstance(o, Variable):
+            for subj in self._pos.get(p, {}).get(o, ()):
+                matches.append({**binding, s: subj})
+        else:
+            for subj, objs in self._spo.get(p, {}).items():
+                for obj in objs:
+                    if s == o and subj != obj:
+                        continue
+                    matches.append({**binding, s: subj, o: obj})
+
+        return matches
+
+    def _join(self, atoms: list[Atom], binding: dict):
+        if not atoms:
+            yield binding
+            return
+
+        # Most bound atom first, to keep intermediate results small.
+        def unbound(atom: Atom) -> int:
+            return sum(1 for term in (atom[0], atom[2]) if isinstance(term, Variable) and term not in binding)
+
+        atom = min(atoms, key=unbound)
+        rest = [other for other in atoms if other is not atom]
+
+        for extended in self._match(atom, binding):
+            yield from self._join(rest, extended)
+
+    def _consequences(self, triple: Triple):
+        for rule, index in self._candidates(self._dispatch, triple):
+            binding = self._unify(rule.body[index], triple)
+
+            if binding is None:
+                continue
+
+            rest = [atom for i, atom in enumerate(rule.body) if i != index]
+
+            for full in self._join(rest, binding):
+                for hs, hp, ho in rule.head:
+                    head = (full.get(hs, hs), hp, full.get(ho, ho))
+
+                    # Literals cannot be subjects, and unbound head variables derive nothing.
+                    if isinstance(head[0], (Literal, Variable)) or isinstance(head[2], Variable):
+                        continue
+
+                    yield head
+
+    def _derivable(self, triple: Triple) -> bool:
+        for rule, index in self._candidates(self._head_dispatch, triple):
+            binding = self._unify(rule.head[index], triple)
+
+            if binding is not None and next(self._join(list(rule.body), binding), None) is not None:
+                return True
+
+        return False
+
+    def _discard(self, triple: Triple) -> None:
+        s, p, o = triple
+        self._spo[p][s].discard(o)
+        self._pos[p][o].discard(s)
+
+    def _propagate(self, delta: set[Triple]) -> set[Triple]:
+        added = set(delta)
+
+        while delta:
+            new = set()
+
+            for triple in delta:
+                for head in self._consequences(triple):
+                    if head not in self and head not in new:
+                        new.add(head)
+
+            for head in new:
+                self._insert(head)
+
+            added |= new
+            delta = new
+
+        return added
+
+    def add(self, triples) -> set[Triple]:
+        """
+        Add explicit triples and return every triple that was not in the closure before.
+        """
+        delta = set()
+
+        for triple in triples:
+            self.explicit.add(triple)
+
+            if triple not in self:
+                self._insert(triple)
+                delta.add(triple)
+
+        return self._propagate(delta)
+
+    def remove(self, triples) -> set[Triple]:
+        """
+        Retract explicit triples and return every triple that left the closure.
+
+        Everything derivable through the retracted triples is first deleted,
+        then whatever still has a derivation from the remaining triples is
+        put back along with its consequences.
+        """
+        delta = set()
+
+        for triple in triples:
+            if triple in self.explicit:
+                self.explicit.discard(triple)
+                delta.add(triple)
+
+        # Overdelete, joining against the closure as it was before the removal.
+        deleted = set(delta)
+
+        while delta:
+            new = set()
+
+            for triple in delta:
+                for head in self._consequences(triple):
+                    if head in self and head not in deleted:
+                        new.add(head)
+
+            deleted |= new
+            delta = new
+
+        for triple in deleted:
+            self._discard(triple)
+
+        # Rederive what still follows in one step from what is left.
+        rederived = {
+            triple
+            for triple in deleted
+            if triple in self.explicit or self._derivable(triple)
+        }
+
+        for triple in rederived:
+            self._insert(triple)
+
+        return deleted - self._propagate(rederived)
+
+    def inferred(self) -> set[Triple]:
+        """
+        Triples of the closure that were not given explicitly.
+        """
+        return {triple for triple in self if triple not in self.explicit}
+
+    def to_graph(self) -> Graph:
+        out = Graph()
+
+        for triple in self:
+            out.add(triple)
+
+        return out
+
+
+def _individuals(graph: Graph) -> set[URIRef]:
+    individuals = set()
+
+    for subj, pred, obj in graph:
+        if isinstance(subj, URIRef):
+            individuals.add(subj)
+        if isinstance(obj, URIRef) and pred != RDF["type"]:
+            individuals.add(obj)
+
+    return individuals
+
+
+# Types of the terms of an ontology, as opposed to its individuals.
+#
+SCHEMA_TYPES = {
+    OWL["Class"],
+    OWL["Restriction"],
+    OWL["ObjectProperty"],
+    OWL["DatatypeProperty"],
+    OWL["AnnotationProperty"],
+    OWL["Ontology"],
+    OWL["AllDisjointClasses"],
+    RDFS["Class"],
+    RDFS["Datatype"],
+    RDF["Property"],
+}
+
+# OWL and RDFS predicates that also apply to individuals.
+#
+INDIVIDUAL_PREDICATES = {
+    OWL["sameAs"],
+    OWL["differentFrom"],
+    RDFS["label"],
+    RDFS["comment"],
+    RDFS["seeAlso"],
+}
+
+
+def abox_individuals(graph: Graph) -> set[URIRef]:
+    """
+    Return the resources a graph uses as individuals, leaving out the terms of the ontology it may also hold.
+
+    Classes, properties and datatypes, the ontology header, the terms used
+    in OWL and RDFS axioms, and what the annotations of all those point to
+    are terms of the ontology. The other subjects, and the objects of their
+    triples but rdf:type ones, are individuals.
+    """
+    schema = set(graph.predicates())
+    schema.update(obj for obj in graph.objects(None, RDF["type"]))
+    schema.update(subj for subj, obj in graph.subject_objects(RDF["type"]) if obj in SCHEMA_TYPES)
+
+    for subj, pred, obj in graph:
+        if str(pred).startswith((str(OWL), str(RDFS))) and pred not in INDIVIDUAL_PREDICATES:
+            schema.update((subj, obj))
+
+    individuals = set()
+
+    for subj, pred, obj in graph:
+        if not isinstance(subj, URIRef) or subj in schema:
+            continue
+
+        individuals.add(subj)
+
+        if isinstance(obj, URIRef) and pred != RDF["type"]:
+            individuals.add(obj)
+
+    return individuals - schema
+
+
+def materialize(
+    graph: Graph,
+    rules: list[Rule],
+    declare_individuals: bool = True,
+) -> Graph:
+    """
+    Return the graph along with everything the rules entail from it.
+
+    Like the ROBOT output, resources used as individuals are typed as
+    owl:NamedIndividual unless declare_individuals is False.
+    """
+    engine = Materializer(rules)
+    engine.add(graph)
+
+    if declare_individuals:
+        engine.add((individual, RDF["type"], OWL["NamedIndividual"]) for individual in _individuals(graph))
+
+    out = engine.to_graph()
+
+    for prefix, namespace in graph.namespaces():
+        out.bind(prefix, namespace)
+
+    return out
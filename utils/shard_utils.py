@@ -0,0 +1,186 @@
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+import heapq
+from typing import Callable
+from rdflib import BNode, Graph, Node, URIRef
+from rdflib.collection import Collection
+from rdflib.namespace import OWL, RDF, RDFS
+
+Triple = tuple[Node, URIRef, Node]
+
+
+def _find(parent: dict[Node, Node], node: Node) -> Node:
+    root = node
+    while parent.setdefault(root, root) != root:
+        root = parent[root]
+
+    # Path compression
+    while parent[node] != root:
+        parent[node], node = root, parent[node]
+
+    return root
+
+
+def joining_predicates(ontology: Graph) -> set[URIRef]:
+    """
+    Return the properties whose triples entail across the resources they link.
+
+    These are owl:sameAs, the transitive properties and the links of the
+    property chains of the ontology, along with their sub-, equivalent and
+    inverse properties. "a partOf hub, hub partOf b" entails "a partOf b",
+    which no component has unless hub joins them.
+    """
+    predicates = {OWL["sameAs"]}
+    predicates.update(ontology.subjects(RDF["type"], OWL["TransitiveProperty"]))
+
+    for chain in ontology.objects(None, OWL["propertyChainAxiom"]):
+        predicates.update(Collection(ontology, chain))
+
+    # (p, q) when p entails q, or the inverse of q.
+    edges = list(ontology.subject_objects(RDFS["subPropertyOf"]))
+    edges += [
+        edge
+        for pred in (OWL["equivalentProperty"], OWL["inverseOf"])
+        for p, q in ontology.subject_objects(pred)
+        for edge in ((p, q), (q, p))
+    ]
+
+    # Up to a fixed point, so that sub-properties of sub-properties join as well.
+    while True:
+        joining = {p for p, q in edges if q in predicates} - predicates
+
+        if not joining:
+            return {pred for pred in predicates if isinstance(pred, URIRef)}
+
+        predicates |= joining
+
+
+def connected_components(
+    graph: Graph,
+    tbox_terms: set[Node] = frozenset(),
+    hub_degree: int | None = None,
+    joining: set[URIRef] = frozenset(),
+) -> list[list[Triple]]:
+    """
+    Split the triples of an instance graph into independent components.
+
+    Two resources end up in the same component when a triple links them.
+    TBox terms (the object of rdf:type, anything in tbox_terms) never link
+    resources, and neither do hubs, the resources used in more than
+    hub_degree triples, like an agent who identified half of the dataset.
+    Triples about a hub alone are copied into every component using it,
+    so each component still sees what is said about the hub.
+
+    Resources used with one of the joining predicates are never hubs, see
+    joining_predicates().
+    """
+    degree = Counter()
+
+    def linkable(node: Node) -> bool:
+        return isinstance(node, (URIRef, BNode)) and node not in tbox_terms
+
+    for subj, pred, obj in graph:
+        degree[subj] += 1
+        if pred != RDF["type"] and linkable(obj):
+            degree[obj] += 1
+
+    hubs = set() if hub_degree is None else {node for node, count in degree.items() if count > hub_degree}
+    hubs -= {node for pred in joining for triple in graph.triples((None, pred, None)) for node in (triple[0], triple[2])}
+    parent: dict[Node, Node] = {}
+
+    for subj, pred, obj in graph:
+        if pred == RDF["type"] or not linkable(obj) or subj in hubs or obj in hubs:
+            continue
+        parent[_find(parent, subj)] = _find(parent, obj)
+
+    components: dict[Node, list[Triple]] = {}
+    hub_triples: dict[Node, list[Triple]] = {}
+    hub_users: dict[Node, set[Node]] = {}
+
+    for subj, pred, obj in graph:
+        obj_linkable = pred != RDF["type"] and linkable(obj)
+
+        if subj in hubs and (not obj_linkable or obj in hubs):
+            hub_triples.setdefault(subj, []).append((subj, pred, obj))
+            continue
+
+        # Triples between a hub and a regular resource go with the regular resource.
+        anchor = obj if subj in hubs else subj
+        root = _find(parent, anchor)
+        components.setdefault(root, []).append((subj, pred, obj))
+
+        for node in (subj, obj):
+            if node in hubs and node != anchor:
+                hub_users.setdefault(node, set()).add(root)
+
+    for hub, triples in hub_triples.items():
+        for root in hub_users.get(hub, ()):
+            components[root].extend(triples)
+
+        # A hub that nothing else uses is a component of its own.
+        if hub not in hub_users:
+            components.setdefault(hub, []).extend(triples)
+
+    return list(components.values())
+
+
+def pack_shards(
+    components: list[list[Triple]],
+    shards: int,
+) -> list[Graph]:
+    """
+    Pack components into at most the given number of graphs of similar size.
+
+    Largest components are placed first, each on the lightest shard so far.
+    """
+    heap = [(0, index) for index in range(shards)]
+    graphs = [Graph() for _ in range(shards)]
+
+    for component in sorted(components, key=len, reverse=True):
+        load, index = heapq.heappop(heap)
+
+        for triple in component:
+            graphs[index].add(triple)
+
+        heapq.heappush(heap, (load + len(component), index))
+
+    return [graph for graph in graphs if len(graph)]
+
+
+def _run_shard(reason: Callable[[Graph], Graph], data: str) -> str:
+    return reason(Graph().parse(data=data, format="nt")).serialize(format="nt")
+
+
+def reason_in_shards(
+    graph: Graph,
+    reason: Callable[[Graph], Graph],
+    shards: int,
+    tbox_terms: set[Node] = frozenset(),
+    hub_degree: int | None = None,
+    joining: set[URIRef] = frozenset(),
+) -> Graph:
+    """
+    Reason over the components of a graph in parallel and merge the results.
+
+    The reason callable is run once per shard in a process pool, so it must
+    be picklable (a module-level function, or a functools.partial of one).
+    Shards travel between processes as N-Triples.
+    """
+    packed = pack_shards(connected_components(graph, tbox_terms, hub_degree, joining), shards)
+
+    out = Graph()
+
+    for prefix, namespace in graph.namespaces():
+        out.bind(prefix, namespace)
+
+    with ProcessPoolExecutor(max_workers=len(packed) or 1) as executor:
+        results = executor.map(
+            _run_shard,
+            [reason] * len(packed),
+            [shard.serialize(format="nt") for shard in packed],
+        )
+
+        for result in results:
+            out.parse(data=result, format="nt")
+
+    return out
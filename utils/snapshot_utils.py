@@ -0,0 +1,250 @@
+from bisect import bisect_left, bisect_right
+from pathlib import Path
+from typing import Iterator
+import json
+import mmap
+import os
+import struct
+import sys
+import tempfile
+from rdflib import BNode, Graph, Literal, Node, URIRef
+
+# Binary snapshot of the ontology, quicker to load than parsing Turtle or
+# RDF/XML. Every term is stored once, in a term table, and the triples as
+# rows of three uint32 term ids. All numbers are little-endian, and the
+# sections start on 4 byte boundaries so that they can be read in place
+# from a memory map.
+#
+#   magic           b"DWCSNAP1"
+#   header          uint32 term count, triple count, text length, metadata length
+#   kinds           uint8 per term, see KINDS, padded
+#   offsets         uint32 per term, plus one, into the text
+#   datatypes       uint32 per term, 1 + the id of the datatype of a literal, 0 otherwise
+#   text            UTF-8, the IRI, blank node label or lexical form of every
+#                   term, "language@lexical form" for literals with a language, padded
+#   metadata        UTF-8 JSON, the namespace bindings, padded
+#   triples         uint32 subject, predicate, object, sorted
+#
+MAGIC = b"DWCSNAP1"
+HEADER = struct.Struct("<4I")
+
+IRI, BLANK, LITERAL, LANGUAGE_LITERAL = range(4)
+
+
+def _padding(length: int) -> bytes:
+    return b"\0" * (-length % 4)
+
+
+def write_snapshot(graph: Graph, path: str | Path) -> None:
+    """
+    Write a graph to a snapshot file.
+
+    Terms are numbered and triples sorted by the N3 form of their terms, so
+    the same graph with the same blank node labels gives the same file.
+    """
+    path = Path(path)
+    terms = sorted({node for triple in graph for node in triple} | {
+        node.datatype for node in graph.objects() if isinstance(node, Literal) and node.datatype is not None
+    }, key=lambda node: node.n3())
+    ids = {node: i for i, node in enumerate(terms)}
+
+    kinds = bytearray()
+    offsets = [0]
+    datatypes = []
+    text = bytearray()
+
+    for node in terms:
+        if isinstance(node, Literal):
+            if node.language:
+                kinds.append(LANGUAGE_LITERAL)
+                text += f"{node.language}@{node}".encode("utf-8")
+            else:
+                kinds.append(LITERAL)
+                text += str(node).encode("utf-8")
+            datatypes.append(0 if node.datatype is None else ids[node.datatype] + 1)
+        else:
+            kinds.append(BLANK if isinstance(node, BNode) else IRI)
+            text += str(node).encode("utf-8")
+            datatypes.append(0)
+
+        offsets.append(len(text))
+
+    metadata = json.dumps({"namespaces": [[prefix, str(namespace)] for prefix, namespace in graph.namespaces()]}).encode("utf-8")
+    triples = sorted((ids[subj], ids[pred], ids[obj]) for subj, pred, obj in graph)
+
+    parts = [
+        MAGIC,
+        HEADER.pack(len(terms), len(triples), len(text), len(metadata)),
+        bytes(kinds), _padding(len(kinds)),
+        struct.pack(f"<{len(offsets)}I", *offsets),
+        struct.pack(f"<{len(datatypes)}I", *datatypes),
+        bytes(text), _padding(len(text)),
+        metadata, _padding(len(metadata)),
+        struct.pack(f"<{3 * len(triples)}I", *(i for triple in triples for i in triple)),
+    ]
+
+    # Write next to the final name and rename, so readers never see half a file.
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.writelines(parts)
+        os.replace(tmp_path, path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+
+class SnapshotView:
+    """
+    Read-only view of a snapshot file, memory mapped.
+
+    Terms are only decoded when asked for. Triples with a given subject are
+    found by binary search, the other patterns scan the triples.
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        with open(path, "rb") as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        buffer = memoryview(self._mmap)
+
+        if bytes(buffer[:len(MAGIC)]) != MAGIC:
+            raise ValueError(f"{path} is not an ontology snapshot")
+
+        position = len(MAGIC)
+        term_count, triple_count, text_length, metadata_length = HEADER.unpack_from(buffer, position)
+        position += HEADER.size
+
+        def section(length: int, fmt: str) -> memoryview:
+            nonlocal position
+            view = buffer[position:position + length]
+            position += length + len(_padding(length))
+            return view.cast(fmt) if fmt != "B" else view
+
+        self._kinds = section(term_count, "B")
+        self._offsets = self._integers(section(4 * (term_count + 1), "I"))
+        self._datatypes = self._integers(section(4 * term_count, "I"))
+        self._text = section(text_length, "B")
+        self.namespaces = [tuple(binding) for binding in json.loads(bytes(section(metadata_length, "B")))["namespaces"]]
+        self._triples = self._integers(section(12 * triple_count, "I"))
+        # Subjects of the triples, sorted, for the binary search.
+        self._subjects = self._triples[0::3]
+
+        self._terms: dict[int, Node] = {}
+        self._ids: dict[Node, int] | None = None
+
+    @staticmethod
+    def _integers(view: memoryview) -> memoryview | list[int]:
+        # The file is little-endian, read in place only where the machine is as well.
+        if sys.byteorder == "little":
+            return view
+        return list(struct.unpack(f"<{len(view)}I", view.tobytes()))
+
+    def __len__(self) -> int:
+        return len(self._subjects)
+
+    def term(self, i: int) -> Node:
+        """
+        Return the term with the given id.
+        """
+        node = self._terms.get(i)
+
+        if node is None:
+            value = bytes(self._text[self._offsets[i]:self._offsets[i + 1]]).decode("utf-8")
+            kind = self._kinds[i]
+
+            if kind == IRI:
+                node = URIRef(value)
+            elif kind == BLANK:
+                node = BNode(value)
+            else:
+                language = None
+                if kind == LANGUAGE_LITERAL:
+                    language, _, value = value.partition("@")
+                datatype = self._datatypes[i]
+                node = Literal(value, lang=language, datatype=self.term(datatype - 1) if datatype else None)
+
+            self._terms[i] = node
+
+        return node
+
+    def term_id(self, node: Node) -> int | None:
+        """
+        Return the id of a term, None when the snapshot does not have it.
+        """
+        if self._ids is None:
+            self._ids = {self.term(i): i for i in range(len(self._kinds))}
+
+        return self._ids.get(node)
+
+    def triples(
+        self,
+        subject: Node | None = None,
+        predicate: Node | None = None,
+        object: Node | None = None,
+    ) -> Iterator[tuple[Node, Node, Node]]:
+        """
+        Iterate over the triples matching a pattern, None matching anything.
+        """
+        pattern = [None if node is None else self.term_id(node) for node in (subject, predicate, object)]
+
+        for node, i in zip((subject, predicate, object), pattern):
+            if node is not None and i is None:
+                return
+
+        rows = self._triples
+
+        if pattern[0] is None:
+            start, stop = 0, len(self)
+        else:
+            start, stop = bisect_left(self._subjects, pattern[0]), bisect_right(self._subjects, pattern[0])
+
+        for row in range(start, stop):
+            s, p, o = rows[3 * row], rows[3 * row + 1], rows[3 * row + 2]
+
+            if (pattern[1] is None or p == pattern[1]) and (pattern[2] is None or o == pattern[2]):
+                yield self.term(s), self.term(p), self.term(o)
+
+    def objects(self, subject: Node, predicate: Node) -> Iterator[Node]:
+        return (obj for _, _, obj in self.triples(subject, predicate))
+
+    def value(self, subject: Node, predicate: Node) -> Node | None:
+        return next(self.objects(subject, predicate), None)
+
+    def __contains__(self, triple: tuple[Node, Node, Node]) -> bool:
+        return next(self.triples(*triple), None) is not None
+
+    def graph(self) -> Graph:
+        """
+        Return the snapshot as an rdflib Graph, with its namespace bindings.
+        """
+        g = Graph()
+        for prefix, namespace in self.namespaces:
+            g.bind(prefix, namespace, override=True, replace=True)
+
+        terms = [self.term(i) for i in range(len(self._kinds))]
+        rows = self._triples
+        g.addN((terms[rows[i]], terms[rows[i + 1]], terms[rows[i + 2]], g) for i in range(0, len(rows), 3))
+
+        return g
+
+    def close(self) -> None:
+        # The views of the memory map have to go before it can be closed.
+        self._kinds = self._offsets = self._datatypes = self._text = self._triples = self._subjects = None
+        self._mmap.close()
+
+    def __enter__(self) -> "SnapshotView":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+def load_snapshot(path: str | Path) -> Graph:
+    """
+    Load a snapshot file as an rdflib Graph.
+    """
+    with SnapshotView(path) as view:
+        return view.graph()
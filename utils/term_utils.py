@@ -0,0 +1,219 @@
+from pathlib import Path
+import hashlib
+import json
+import os
+import pickle
+import tempfile
+from rdflib import Graph, Literal, Namespace, URIRef
+#
+from utils import base
+from utils.base import createDP, createEDP, createEOC, createNI, createOC, createOP, createRDP, createSC, createSCS
+
+# Term tables, one JSON file per namespace, and the compiled triples of their terms.
+#
+TERMS_DIR = Path(__file__).parent.parent / "terms"
+CACHE_DIR = Path(__file__).parent.parent / ".cache" / "terms"
+
+BUILDERS = {
+    "createDP": createDP,
+    "createEDP": createEDP,
+    "createEOC": createEOC,
+    "createNI": createNI,
+    "createOC": createOC,
+    "createOP": createOP,
+    "createRDP": createRDP,
+    "createSC": createSC,
+    "createSCS": createSCS,
+}
+
+# Arguments the builders only accept as tuples, JSON has lists only.
+#
+TUPLE_ARGUMENTS = {"equiv_def"}
+
+
+# A term file looks like
+#
+#   {
+#     "prefixes": {"dwc": "http://rs.tdwg.org/dwc/terms/", ...},
+#     "terms": [
+#       {"builder": "createOC", "name": "Event", "namespace": "dwc", "pref_label": {"@value": "Event", "@language": "en"}, ...},
+#       ...
+#     ]
+#   }
+#
+# Every key of a term but "builder", "notes" and "disabled" is an argument of
+# its builder. Disabled terms are kept in the table but not built.
+# IRIs are {"@id": "prefix:name"} or {"@id": full IRI}, literals are
+# {"@value": ..., "@language": ...} or {"@value": ..., "@type": "prefix:name"},
+# the namespace argument is a prefix. Anything else is passed as is.
+#
+def decode_value(value: object, prefixes: dict[str, str]) -> object:
+    """
+    Turn the JSON form of a builder argument back into the argument.
+    """
+    def expand(iri: str) -> URIRef:
+        prefix, _, name = iri.partition(":")
+        return URIRef(prefixes[prefix] + name) if prefix in prefixes else URIRef(iri)
+
+    if isinstance(value, dict):
+        if "@id" in value:
+            return expand(value["@id"])
+
+        datatype = value.get("@type")
+        return Literal(value["@value"], lang=value.get("@language"), datatype=None if datatype is None else expand(datatype))
+
+    if isinstance(value, list):
+        return [decode_value(item, prefixes) for item in value]
+
+    return value
+
+
+def build_term(term: dict, prefixes: dict[str, str], graph: Graph) -> None:
+    """
+    Add the triples of one term of a term file to a graph, through its builder of utils/base.py.
+    """
+    kwargs = {}
+
+    for key, value in term.items():
+        if key in ("builder", "notes", "disabled"):
+            continue
+
+        if key == "namespace":
+            kwargs[key] = Namespace(prefixes[value])
+        elif key in TUPLE_ARGUMENTS:
+            kwargs[key] = tuple(decode_value(value, prefixes))
+        else:
+            kwargs[key] = decode_value(value, prefixes)
+
+    BUILDERS[term["builder"]](graph=graph, **kwargs)
+
+
+def build_terms(terms: dict, graph: Graph) -> None:
+    """
+    Add the triples of the terms of a term file to a graph.
+    """
+    for term in terms["terms"]:
+        if not term.get("disabled"):
+            build_term(term, terms["prefixes"], graph)
+
+
+def _builder_digest() -> bytes:
+    # The triples of a term also depend on the code turning it into triples.
+    digest = hashlib.sha256()
+
+    for source in (Path(base.__file__), Path(__file__)):
+        digest.update(source.read_bytes())
+
+    return digest.digest()
+
+
+def term_fingerprint(term: dict, prefixes: dict[str, str], builder_digest: bytes) -> str:
+    """
+    Hash what the triples of a term depend on, its notes aside.
+    """
+    arguments = {key: value for key, value in term.items() if key != "notes"}
+    digest = hashlib.sha256(builder_digest)
+    digest.update(json.dumps([arguments, prefixes], sort_keys=True).encode("utf-8"))
+
+    return digest.hexdigest()
+
+
+def load_term_file(
+    path: str | Path,
+    graph: Graph,
+    cache_dir: str | Path | None = CACHE_DIR,
+    builder_digest: bytes | None = None,
+) -> int:
+    """
+    Add the triples of a term file to a graph, and return how many terms were built.
+
+    The triples of each term are kept in cache_dir under a fingerprint of
+    the term, so that editing a definition only builds that term again.
+    Without a cache_dir every term is built.
+    """
+    path = Path(path)
+    terms = json.loads(path.read_text(encoding="utf-8"))
+    prefixes = terms["prefixes"]
+    enabled = [term for term in terms["terms"] if not term.get("disabled")]
+
+    if cache_dir is None:
+        for term in enabled:
+            build_term(term, prefixes, graph)
+        return len(enabled)
+
+    if builder_digest is None:
+        builder_digest = _builder_digest()
+
+    cache_dir = Path(cache_dir)
+    compiled_path = cache_dir / f"{path.stem}.pickle"
+
+    try:
+        with open(compiled_path, "rb") as f:
+            compiled = pickle.load(f)
+    except (FileNotFoundError, EOFError, pickle.UnpicklingError):
+        compiled = {}
+
+    # fingerprint -> triples of the term, for the terms of the file only
+    current = {}
+    built = 0
+
+    for term in enabled:
+        fingerprint = term_fingerprint(term, prefixes, builder_digest)
+        triples = compiled.get(fingerprint)
+
+        if triples is None:
+            g_term = Graph()
+            build_term(term, prefixes, g_term)
+            triples = list(g_term)
+            built += 1
+
+        current[fingerprint] = triples
+        graph.addN((subj, pred, obj, graph) for subj, pred, obj in triples)
+
+    if built or current.keys() != compiled.keys():
+        cache_dir.mkdir(parents=True, exist_ok=True)
+
+        # Write next to the final name and rename, so readers never see half a file.
+        fd, tmp_path = tempfile.mkstemp(dir=cache_dir, suffix=".tmp")
+        os.close(fd)
+
+        try:
+            with open(tmp_path, "wb") as f:
+                pickle.dump(current, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, compiled_path)
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+    return built
+
+
+def term_files(
+    prefixes: list[str] | None = None,
+    directory: str | Path = TERMS_DIR,
+) -> list[Path]:
+    """
+    Return the term files of the namespaces with the given prefixes, all of them by default.
+    """
+    directory = Path(directory)
+
+    if prefixes is None:
+        return sorted(directory.glob("*.json"))
+
+    return [directory / f"{prefix}.json" for prefix in prefixes]
+
+
+def load_terms(
+    graph: Graph,
+    prefixes: list[str] | None = None,
+    directory: str | Path = TERMS_DIR,
+    cache_dir: str | Path | None = CACHE_DIR,
+) -> int:
+    """
+    Add the terms of the namespaces with the given prefixes to a graph, all of
+    them by default, and return how many terms were built rather than read
+    from cache_dir.
+    """
+    builder_digest = None if cache_dir is None else _builder_digest()
+
+    return sum(load_term_file(path, graph, cache_dir, builder_digest) for path in term_files(prefixes, directory))